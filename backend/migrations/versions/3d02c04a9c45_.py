@@ -0,0 +1,40 @@
+"""empty message
+
+Revision ID: 3d02c04a9c45
+Revises: a612fd09d3c8
+Create Date: 2026-10-18 20:42:13.518204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d02c04a9c45"
+down_revision: Union[str, None] = "a612fd09d3c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("tvdbshowcache") as batch_op:
+        batch_op.alter_column(
+            "data_raw",
+            existing_type=sa.VARCHAR(),
+            type_=sa.JSON(),
+            existing_nullable=False,
+            postgresql_using="data_raw::json",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("tvdbshowcache") as batch_op:
+        batch_op.alter_column(
+            "data_raw",
+            existing_type=sa.JSON(),
+            type_=sa.VARCHAR(),
+            existing_nullable=False,
+            postgresql_using="data_raw::text",
+        )
@@ -0,0 +1,99 @@
+"""empty message
+
+Revision ID: a612fd09d3c8
+Revises: 017b29fd5fa8
+Create Date: 2026-10-18 19:45:45.132661
+
+"""
+
+import json
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a612fd09d3c8"
+down_revision: Union[str, None] = "017b29fd5fa8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = {
+    "release": ["prowlarr_data_raw", "torrent_stats_raw"],
+    "show": ["sonarr_data_raw", "tvdb_data_raw", "prowlarr_data_raw"],
+}
+
+
+def upgrade() -> None:
+    # Search results were stored as a JSON array of JSON strings
+    show = sa.table(
+        "show",
+        sa.column("id", sa.Integer()),
+        sa.column("prowlarr_data_raw", sa.String()),
+    )
+    conn = op.get_bind()
+    for show_id, prowlarr_data_raw in conn.execute(
+        sa.select(show.c.id, show.c.prowlarr_data_raw).where(
+            show.c.prowlarr_data_raw.is_not(None)
+        )
+    ):
+        conn.execute(
+            show.update()
+            .where(show.c.id == show_id)
+            .values(
+                prowlarr_data_raw=json.dumps(
+                    [json.loads(obj) for obj in json.loads(prowlarr_data_raw)]
+                )
+            )
+        )
+
+    release = sa.table("release", sa.column("prowlarr_data_raw", sa.String()))
+    conn.execute(
+        release.update()
+        .where(release.c.prowlarr_data_raw == "")
+        .values(prowlarr_data_raw=None)
+    )
+
+    for table_name, column_names in JSON_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch_op:
+            for column_name in column_names:
+                batch_op.alter_column(
+                    column_name,
+                    existing_type=sa.VARCHAR(),
+                    type_=sa.JSON(),
+                    postgresql_using=f"{column_name}::json",
+                )
+
+
+def downgrade() -> None:
+    for table_name, column_names in JSON_COLUMNS.items():
+        with op.batch_alter_table(table_name) as batch_op:
+            for column_name in column_names:
+                batch_op.alter_column(
+                    column_name,
+                    existing_type=sa.JSON(),
+                    type_=sa.VARCHAR(),
+                    postgresql_using=f"{column_name}::text",
+                )
+
+    show = sa.table(
+        "show",
+        sa.column("id", sa.Integer()),
+        sa.column("prowlarr_data_raw", sa.String()),
+    )
+    conn = op.get_bind()
+    for show_id, prowlarr_data_raw in conn.execute(
+        sa.select(show.c.id, show.c.prowlarr_data_raw).where(
+            show.c.prowlarr_data_raw.is_not(None)
+        )
+    ):
+        conn.execute(
+            show.update()
+            .where(show.c.id == show_id)
+            .values(
+                prowlarr_data_raw=json.dumps(
+                    [json.dumps(obj) for obj in json.loads(prowlarr_data_raw)]
+                )
+            )
+        )
@@ -1,10 +1,18 @@
 from typing import Protocol
 
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.models import Release, ReleaseFileMatching
 
 
+class DTO_ReleaseTorrentStatsUpdate(BaseModel):
+    name: str
+    torrent_is_finished: bool
+    torrent_stats_raw: dict
+    torrent_stats_hash: str
+
+
 class I_ReleasesRepository(Protocol):
     async def create(self, db_session: AsyncSession, release: Release) -> None: ...
 
@@ -16,6 +24,12 @@ class I_ReleasesRepository(Protocol):
         self, db_session: AsyncSession, file_matchings: list[ReleaseFileMatching]
     ) -> None: ...
 
+    async def get_all(self, db_session: AsyncSession) -> list[Release]: ...
+
+    async def bulk_update_torrent_stats(
+        self, db_session: AsyncSession, updates: list[DTO_ReleaseTorrentStatsUpdate]
+    ) -> int: ...
+
     async def get_by_torrent_hashes(
         self, db_session: AsyncSession, torrent_hashes: list[str]
     ) -> list[Release]: ...
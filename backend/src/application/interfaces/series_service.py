@@ -45,9 +45,14 @@ class SeriesImportFile(BaseModel):
 class E_SeriesManualImportError(Exception): ...
 
 
+class E_SeriesServiceUnavailableError(E_SeriesManualImportError): ...
+
+
 class I_SeriesService(Protocol):
     async def get_missing(self) -> list[MissingSeries]: ...
 
+    async def get_series_hashes(self) -> dict[int, str]: ...
+
     async def get_series(self, series_id) -> Series: ...
 
     async def manual_import(self, import_files: list[SeriesImportFile]) -> None: ...
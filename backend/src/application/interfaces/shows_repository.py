@@ -15,6 +15,11 @@ class I_ShowsRepository(Protocol):
     async def get_series(self, db_session: AsyncSession, series_id: int) -> Show | None:
         raise NotImplementedError
 
+    async def get_many_by_series_ids(
+        self, db_session: AsyncSession, series_ids: list[int]
+    ) -> list[Show]:
+        raise NotImplementedError
+
     async def save_releases_seach_results(
         self,
         db_session: AsyncSession,
@@ -24,7 +29,14 @@ class I_ShowsRepository(Protocol):
     ) -> None:
         raise NotImplementedError
 
-    async def unflag_all_missing_series(self, db_session: AsyncSession) -> None:
+    async def unflag_all_missing_series(
+        self, db_session: AsyncSession, except_series_ids: list[int] | None = None
+    ) -> None:
+        raise NotImplementedError
+
+    async def update_missing_seasons(
+        self, db_session: AsyncSession, missing_seasons: dict[int, list[int]]
+    ) -> None:
         raise NotImplementedError
 
     async def save(self, db_session: AsyncSession, show: Show) -> None:
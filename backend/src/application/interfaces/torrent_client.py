@@ -64,9 +64,29 @@ class TorrentStats(BaseModel):
         json_encoders = {datetime: lambda v: int(v.timestamp())}
 
 
+class TorrentInfo(BaseModel):
+    hash: str
+    name: str
+    state: str
+    progress: float
+    amount_left: int
+    completion_on: datetime
+    save_path: str
+    content_path: str
+
+    class Config:
+        json_encoders = {datetime: lambda v: int(v.timestamp())}
+
+
 class I_TorrentClient(Protocol):
     async def add_torrent(self, raw_torrent: bytes) -> None: ...
 
+    async def add_torrent_and_wait(
+        self, raw_torrent: bytes, info_hash: str, timeout: float = 10
+    ) -> dict: ...
+
     async def torrent_properties(self, hash: str) -> dict: ...
 
     async def get_stats(self) -> Stats: ...
+
+    async def get_torrents_info(self, hashes: list[str]) -> dict[str, TorrentInfo]: ...
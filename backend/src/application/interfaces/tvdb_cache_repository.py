@@ -0,0 +1,13 @@
+from typing import Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.models import TvdbShowCache
+
+
+class I_TvdbCacheRepository(Protocol):
+    async def get_many(
+        self, db_session: AsyncSession, tvdb_ids: list[int]
+    ) -> list[TvdbShowCache]: ...
+
+    async def save(self, db_session: AsyncSession, entry: TvdbShowCache) -> None: ...
@@ -1,6 +1,6 @@
 import asyncio
-import json
 from datetime import datetime
+from typing import Any, Callable
 
 from pydantic import computed_field
 from sqlalchemy import types
@@ -11,37 +11,86 @@ from src.infrastructure.api_clients.sonarr import Series
 from src.infrastructure.api_clients.tvdb import TvdbShowData
 
 
+def _cached_by_raw[T](
+    instance: SQLModel, cache_name: str, raw: Any, build: Callable[[], T]
+) -> T:
+    # Values are built once per instance and rebuilt only when the raw value
+    # they come from gets reassigned. The cache is keyed on the identity of the
+    # raw value, so changing a raw dict or list in place doesn't invalidate it
+    cached = instance.__dict__.get(cache_name)
+    if cached is None or cached[0] is not raw:
+        cached = (raw, build())
+        instance.__dict__[cache_name] = cached
+    return cached[1]
+
+
 class Show(SQLModel, table=True):
     id: int = Field(default=None, primary_key=True)
     sonarr_id: int | None = Field(unique=True)
-    sonarr_data_raw: str = Field(exclude=True)
-    tvdb_data_raw: str = Field(exclude=True)
+    sonarr_data_raw: dict = Field(sa_type=types.JSON, exclude=True)
+    sonarr_data_hash: str | None = Field(default=None, nullable=True, exclude=True)
+    tvdb_data_raw: dict = Field(sa_type=types.JSON, exclude=True)
     is_missing: bool = Field(default=False, index=True)
     missing_seasons: list[int] = Field(default=None, sa_type=types.JSON)
     prowlarr_search: str | None
-    prowlarr_data_raw: str | None = Field(exclude=True)
+    prowlarr_data_raw: list[dict] | None = Field(sa_type=types.JSON, exclude=True)
 
     releases: list["Release"] = Relationship(back_populates="show")
 
     @computed_field
     @property
     def sonarr_data(self) -> Series:
-        return Series.model_validate_json(self.sonarr_data_raw)
+        return _cached_by_raw(
+            self,
+            "_sonarr_data_cache",
+            self.sonarr_data_raw,
+            lambda: Series.model_validate(self.sonarr_data_raw),
+        )
+
+    def get_sonarr_episode_id(
+        self, season_number: int, episode_number: int
+    ) -> int | None:
+        return self._sonarr_episode_ids.get((season_number, episode_number))
+
+    @property
+    def _sonarr_episode_ids(self) -> dict[tuple[int, int], int]:
+        return _cached_by_raw(
+            self,
+            "_sonarr_episode_ids_cache",
+            self.sonarr_data_raw,
+            lambda: {
+                (season.season_number, episode.episode_number): episode.id
+                for season in self.sonarr_data.seasons
+                for episode in season.episodes
+            },
+        )
 
     @computed_field
     @property
     def tvdb_data(self) -> TvdbShowData:
-        return TvdbShowData.model_validate_json(self.tvdb_data_raw)
+        return _cached_by_raw(
+            self,
+            "_tvdb_data_cache",
+            self.tvdb_data_raw,
+            lambda: TvdbShowData.model_validate(self.tvdb_data_raw),
+        )
 
     @computed_field
     @property
     def prowlarr_data(self) -> list[ReleaseData]:
-        if not self.prowlarr_data_raw:
-            return []
-        return [
-            ReleaseData.model_validate_json(obj)
-            for obj in json.loads(self.prowlarr_data_raw)
-        ]
+        return _cached_by_raw(
+            self,
+            "_prowlarr_data_cache",
+            self.prowlarr_data_raw,
+            lambda: [
+                ReleaseData.model_validate(obj) for obj in self.prowlarr_data_raw or []
+            ],
+        )
+
+
+class ShowMissingSeason(SQLModel, table=True):
+    show_id: int = Field(foreign_key="show.id", primary_key=True)
+    season_number: int = Field(primary_key=True)
 
 
 class Release(SQLModel, table=True):
@@ -49,12 +98,18 @@ class Release(SQLModel, table=True):
     updated_at: datetime
     search: str
     prowlarr_guid: str = Field(default="", nullable=True)
-    prowlarr_data_raw: str = Field(default="", nullable=True)
+    prowlarr_data_raw: dict | None = Field(
+        default=None, nullable=True, sa_type=types.JSON
+    )
+    prowlarr_fingerprint: str = Field(default=None, nullable=True)
     show_id: int = Field(default=None, foreign_key="show.id")
     qbittorrent_guid: str
     qbittorrent_data: str
     torrent_is_finished: bool = Field(default=False)
-    torrent_stats_raw: str = Field(default=None, nullable=True)
+    torrent_stats_raw: dict | None = Field(
+        default=None, nullable=True, sa_type=types.JSON
+    )
+    torrent_stats_hash: str = Field(default=None, nullable=True)
     last_imported_files_hash: str = Field(default=None, nullable=True)
     last_exported_torrent_guid: str = Field(default=None, nullable=True)
     export_failures_count: int = Field(default=0)
@@ -64,9 +119,26 @@ class Release(SQLModel, table=True):
 
     @property
     def prowlarr_data(self) -> ReleaseData:
-        if not self.prowlarr_data_raw:
-            return None
-        return ReleaseData.model_validate_json(self.prowlarr_data_raw)
+        return _cached_by_raw(
+            self,
+            "_prowlarr_data_cache",
+            self.prowlarr_data_raw,
+            lambda: (
+                ReleaseData.model_validate(self.prowlarr_data_raw)
+                if self.prowlarr_data_raw
+                else None
+            ),
+        )
+
+
+class TvdbShowCache(SQLModel, table=True):
+    tvdb_id: int = Field(primary_key=True)
+    data_raw: dict = Field(sa_type=types.JSON)
+    fetched_at: datetime
+
+    @property
+    def data(self) -> TvdbShowData:
+        return TvdbShowData.model_validate(self.data_raw)
 
 
 class ReleaseFileMatching(SQLModel, table=True):
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from datetime import datetime
 
 from pydantic import BaseModel
@@ -15,6 +17,21 @@ class ReleaseData(BaseModel):
     seeders: int
     leechers: int
     download_url: str
+    publish_date: datetime | None = None
+
+    @property
+    def fingerprint(self) -> str:
+        # `age` is only a fallback as it changes every day
+        return hashlib.md5(
+            json.dumps(
+                [
+                    self.guid,
+                    self.title,
+                    self.size,
+                    self.publish_date.isoformat() if self.publish_date else self.age,
+                ]
+            ).encode()
+        ).hexdigest()
 
     @property
     def pk(self):
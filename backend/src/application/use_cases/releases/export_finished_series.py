@@ -7,7 +7,11 @@ import loguru
 
 from src.application.interfaces.db_manager import I_DBManager
 from src.application.interfaces.releases_repository import I_ReleasesRepository
-from src.application.interfaces.series_service import I_SeriesService, SeriesImportFile
+from src.application.interfaces.series_service import (
+    E_SeriesServiceUnavailableError,
+    I_SeriesService,
+    SeriesImportFile,
+)
 from src.application.models import Release
 from src.application.schemas import TorrentFile
 from src.infrastructure.api_clients.sonarr import E_SeriesManualImportError
@@ -63,6 +67,13 @@ class UseCase_ExportFinishedSeries:
 
                 res.succeded += 1
 
+            except E_SeriesServiceUnavailableError:
+                # Sonarr being down says nothing about the release itself, so
+                # it doesn't bring the release closer to being given up on
+                self.logger.warning(f"Sonarr is unavailable, skipping `{release.name}`")
+                res.failed += 1
+                continue
+
             except E_SeriesManualImportError:
                 release.export_failures_count += 1
                 res.failed += 1
@@ -80,13 +91,9 @@ class UseCase_ExportFinishedSeries:
         import_files = []
         torrent_data: TorrentFile = json.loads(release.qbittorrent_data)
         for file_matching in release.file_matchings:
-            episode_id = None
-            for season in release.show.sonarr_data.seasons:
-                if season.season_number != file_matching.season_number:
-                    continue
-                for episode in season.episodes:
-                    if episode.episode_number == file_matching.episode_number:
-                        episode_id = episode.id
+            episode_id = release.show.get_sonarr_episode_id(
+                file_matching.season_number, file_matching.episode_number
+            )
             if episode_id is not None:
                 import_files.append(
                     SeriesImportFile(
@@ -55,14 +55,16 @@ class UseCase_GrabRelease:
         meta, raw_torrent = await self.release_searcher.get_torrent(
             release_data.download_url
         )
-        await self.torrent_client.add_torrent(raw_torrent)
-        torrent_data = await self.torrent_client.torrent_properties(meta.info_hash)
+        torrent_data = await self.torrent_client.add_torrent_and_wait(
+            raw_torrent, meta.info_hash
+        )
 
         release = Release(
             name=torrent_data["name"],
             updated_at=datetime.now(),
             search=show.prowlarr_search,
-            prowlarr_data_raw=release_data.model_dump_json(),
+            prowlarr_data_raw=release_data.model_dump(mode="json"),
+            prowlarr_fingerprint=release_data.fingerprint,
             show_id=show_id,
             qbittorrent_guid=meta.info_hash,
             qbittorrent_data=json.dumps(torrent_data),
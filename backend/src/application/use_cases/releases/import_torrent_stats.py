@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import hashlib
+
 import loguru
 
 from src.application.interfaces.db_manager import I_DBManager
-from src.application.interfaces.releases_repository import I_ReleasesRepository
+from src.application.interfaces.releases_repository import (
+    DTO_ReleaseTorrentStatsUpdate,
+    I_ReleasesRepository,
+)
 from src.application.interfaces.torrent_client import I_TorrentClient
 
 
+class DTO_ImportReleasesTorrentStatsResult:
+    updated: int = 0
+    unchanged: int = 0
+    not_found: int = 0
+
+
 class UseCase_ImportReleasesTorrentStats:
     def __init__(
         self,
@@ -20,24 +31,62 @@ class UseCase_ImportReleasesTorrentStats:
         self.releases_repository = releases_repository
         self.logger = logger
 
-    async def process(self) -> None:
+    async def process(self) -> DTO_ImportReleasesTorrentStatsResult:
         self.logger.info("Importing torrent stats")
         with self.logger.catch(reraise=True):
             return await self._process()
 
-    async def _process(self) -> None:
+    async def _process(self) -> DTO_ImportReleasesTorrentStatsResult:
+        res = DTO_ImportReleasesTorrentStatsResult()
+
         async with self.db_manager.begin_session() as db_session:
-            stats = await self.torrent_client.get_stats()
-            torrent_hashes = [t.infohash_v1 for t in stats.torrents.values()]
-            releases = await self.releases_repository.get_by_torrent_hashes(
-                db_session=db_session, torrent_hashes=torrent_hashes
+            releases = await self.releases_repository.get_all(db_session=db_session)
+        if not releases:
+            return res
+
+        torrents_info = await self.torrent_client.get_torrents_info(
+            [release.qbittorrent_guid for release in releases]
+        )
+
+        updates: list[DTO_ReleaseTorrentStatsUpdate] = []
+        for release in releases:
+            torrent_info = torrents_info.get(release.qbittorrent_guid)
+            if torrent_info is None:
+                res.not_found += 1
+                continue
+
+            torrent_is_finished = (
+                torrent_info.completion_on.timestamp() > 0
+            ) and torrent_info.progress >= 1
+            torrent_stats_hash = hashlib.md5(
+                torrent_info.model_dump_json().encode()
+            ).hexdigest()
+            if (
+                release.torrent_is_finished == torrent_is_finished
+                and release.torrent_stats_hash == torrent_stats_hash
+            ):
+                res.unchanged += 1
+                continue
+
+            updates.append(
+                DTO_ReleaseTorrentStatsUpdate(
+                    name=release.name,
+                    torrent_is_finished=torrent_is_finished,
+                    torrent_stats_raw=torrent_info.model_dump(mode="json"),
+                    torrent_stats_hash=torrent_stats_hash,
+                )
             )
-            for release in releases:
-                torrent_stats = stats.torrents[release.qbittorrent_guid]
-                release.torrent_is_finished = (
-                    torrent_stats.completion_on.timestamp() > 0
-                ) and torrent_stats.progress >= 1
-                release.torrent_stats_raw = torrent_stats.model_dump_json()
-                await self.releases_repository.update(
-                    db_session=db_session, release=release
+
+        if updates:
+            async with self.db_manager.begin_session() as db_session:
+                res.updated = await self.releases_repository.bulk_update_torrent_stats(
+                    db_session=db_session, updates=updates
                 )
+
+        self.logger.info(
+            "Imported torrent stats",
+            updated=res.updated,
+            unchanged=res.unchanged,
+            not_found=res.not_found,
+        )
+        return res
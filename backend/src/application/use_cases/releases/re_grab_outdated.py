@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+from collections import defaultdict
 from datetime import datetime
 
 import loguru
@@ -26,6 +27,7 @@ class UseCase_ReGrabOutdatedReleases:
         releases_repository: I_ReleasesRepository,
         release_files_matching_autocompleter: ReleaseFileMatchingsAutocompleter,
         logger: loguru.Logger,
+        indexer_concurrency: int = 2,
     ) -> None:
         self.db_manager = db_manager
         self.release_searcher = release_searcher
@@ -33,6 +35,7 @@ class UseCase_ReGrabOutdatedReleases:
         self.releases_repository = releases_repository
         self.release_files_matching_autocompleter = release_files_matching_autocompleter
         self.logger = logger
+        self.indexer_concurrency = indexer_concurrency
 
     async def process(self) -> None:
         self.logger.info("Regrabbing outdated releases")
@@ -45,65 +48,103 @@ class UseCase_ReGrabOutdatedReleases:
                 db_session=db_session
             )
 
+        releases_by_search: dict[tuple[str, int], list[Release]] = defaultdict(list)
         for release in outdated_releases:
-            try:
-                found_releases_data = await self.release_searcher.search(
-                    release.search, [release.prowlarr_data.indexer_id]
+            if release.prowlarr_data is None:
+                self.logger.warning("Release has no search data!", name=release.name)
+                continue
+            releases_by_search[
+                (release.search, release.prowlarr_data.indexer_id)
+            ].append(release)
+
+        indexer_semaphores: dict[int, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.indexer_concurrency)
+        )
+
+        async def _search(search: str, indexer_id: int) -> list[ReleaseData]:
+            async with indexer_semaphores[indexer_id]:
+                return await self.release_searcher.search(search, [indexer_id])
+
+        search_results = await asyncio.gather(
+            *[_search(*search_key) for search_key in releases_by_search],
+            return_exceptions=True,
+        )
+
+        for ((search, _), releases), found_releases_data in zip(
+            releases_by_search.items(), search_results
+        ):
+            if isinstance(found_releases_data, Exception):
+                self.logger.opt(exception=found_releases_data).error(
+                    f"Can't search `{search}`"
                 )
-                current_release_data = self._find_release_data(
-                    release=release, releases_data=found_releases_data
-                )
-                if current_release_data is None:
-                    self.logger.warning(
-                        "Couldn't find the release!",
-                        name=release.name,
-                        pk=release.prowlarr_data.pk,
-                    )
-                    continue
+                continue
+            for release in releases:
+                await self._re_grab_release(release, found_releases_data)
 
-                new_torrent_meta, raw_torrent = await self.release_searcher.get_torrent(
-                    current_release_data.download_url
+    async def _re_grab_release(
+        self, release: Release, found_releases_data: list[ReleaseData]
+    ) -> None:
+        try:
+            current_release_data = self._find_release_data(
+                release=release, releases_data=found_releases_data
+            )
+            if current_release_data is None:
+                self.logger.warning(
+                    "Couldn't find the release!",
+                    name=release.name,
+                    pk=release.prowlarr_data.pk,
                 )
+                return
 
-                # TODO: Perform this check without downloading the torrent. Mb we can
-                # save the release data and then compare it instead of the infohash.
-                # Do not try to use the infohash from `current_release_data` as it is
-                # not always provided by prowlarr
-                if new_torrent_meta.info_hash == release.qbittorrent_guid:
-                    continue
+            if release.prowlarr_fingerprint == current_release_data.fingerprint:
+                return
 
-                file_matchings = self._add_new_file_matchings(
-                    release=release, new_torrent_meta=new_torrent_meta
-                )
-
-                await self.torrent_client.add_torrent(raw_torrent)
-                await asyncio.sleep(1)
-                new_torrent_data = await self.torrent_client.torrent_properties(
-                    new_torrent_meta.info_hash
-                )
+            new_torrent_meta, raw_torrent = await self.release_searcher.get_torrent(
+                current_release_data.download_url
+            )
 
+            # Do not try to use the infohash from `current_release_data` as it is
+            # not always provided by prowlarr
+            if new_torrent_meta.info_hash == release.qbittorrent_guid:
                 async with self.db_manager.begin_session() as db_session:
-                    release.name = new_torrent_data["name"]
-                    release.updated_at = datetime.now()
-                    release.qbittorrent_guid = new_torrent_meta.info_hash
-                    release.qbittorrent_data = json.dumps(new_torrent_data)
-                    release.export_failures_count = 0
-
+                    release.prowlarr_fingerprint = current_release_data.fingerprint
                     await self.releases_repository.update(
                         db_session=db_session, release=release
                     )
-                    await self.releases_repository.update_file_matchings(
-                        db_session=db_session, file_matchings=file_matchings
-                    )
-            except Exception:
-                self.logger.exception(f"Can't regrab `{release.name}`")
+                return
+
+            file_matchings = self._add_new_file_matchings(
+                release=release, new_torrent_meta=new_torrent_meta
+            )
+
+            new_torrent_data = await self.torrent_client.add_torrent_and_wait(
+                raw_torrent, new_torrent_meta.info_hash
+            )
+
+            async with self.db_manager.begin_session() as db_session:
+                release.name = new_torrent_data["name"]
+                release.updated_at = datetime.now()
+                release.qbittorrent_guid = new_torrent_meta.info_hash
+                release.qbittorrent_data = json.dumps(new_torrent_data)
+                release.prowlarr_fingerprint = current_release_data.fingerprint
+                release.export_failures_count = 0
+
+                await self.releases_repository.update(
+                    db_session=db_session, release=release
+                )
+                await self.releases_repository.update_file_matchings(
+                    db_session=db_session, file_matchings=file_matchings
+                )
+        except Exception:
+            self.logger.exception(f"Can't regrab `{release.name}`")
 
     @staticmethod
     def _find_release_data(
         release: Release, releases_data: list[ReleaseData]
     ) -> ReleaseData | None:
+        release_pk = release.prowlarr_data.pk
         for release_data in releases_data:
-            if release_data.pk == release.prowlarr_data.pk:
+            if release_data.pk == release_pk:
                 return release_data
 
     def _add_new_file_matchings(self, release: Release, new_torrent_meta: TorrentMeta):
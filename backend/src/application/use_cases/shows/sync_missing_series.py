@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import loguru
 
 from src.application.interfaces.db_manager import I_DBManager
@@ -11,6 +13,7 @@ from src.application.interfaces.series_service import (
 from src.application.interfaces.shows_repository import I_ShowsRepository
 from src.application.interfaces.tvdb_client import I_TvdbClient, TvdbShowData
 from src.application.models import Show
+from src.application.utility.tvdb_show_data_cache import TvdbShowDataCache
 
 
 class UseCase_SyncMissingSeries:
@@ -20,63 +23,162 @@ class UseCase_SyncMissingSeries:
         series_service: I_SeriesService,
         shows_repository: I_ShowsRepository,
         tvdb_client: I_TvdbClient,
+        tvdb_cache: TvdbShowDataCache,
         logger: loguru.Logger,
+        series_service_concurrency: int = 5,
+        tvdb_concurrency: int = 5,
     ) -> None:
         self.db_manager = db_manager
         self.series_service = series_service
         self.shows_repository = shows_repository
         self.tvdb_client = tvdb_client
+        self.tvdb_cache = tvdb_cache
         self.logger = logger
 
-    async def process(self) -> None:
-        self.logger.info("Syncing missing series")
+        self._series_service_semaphore = asyncio.Semaphore(series_service_concurrency)
+        self._tvdb_semaphore = asyncio.Semaphore(tvdb_concurrency)
+
+    async def process(self, force_tvdb_refresh: bool = False) -> None:
+        self.logger.info(
+            "Syncing missing series", force_tvdb_refresh=force_tvdb_refresh
+        )
         with self.logger.catch(reraise=True):
-            return await self._process()
+            return await self._process(force_tvdb_refresh=force_tvdb_refresh)
+
+    async def _process(self, force_tvdb_refresh: bool) -> None:
+        missing_seriess, series_hashes = await asyncio.gather(
+            self.series_service.get_missing(),
+            self.series_service.get_series_hashes(),
+        )
+        series_ids = [ms.id for ms in missing_seriess]
 
-    async def _process(self) -> None:
-        missing_seriess = await self.series_service.get_missing()
+        cached_tvdb_data: dict[int, TvdbShowData] = {}
         async with self.db_manager.begin_session() as db_session:
-            with db_session.no_autoflush:
-                await self.shows_repository.unflag_all_missing_series(db_session)
-                for missing_series in missing_seriess:
-                    show = await self.shows_repository.get_series(
-                        db_session=db_session, series_id=missing_series.id
+            existing_shows = {
+                show.sonarr_id: show
+                for show in await self.shows_repository.get_many_by_series_ids(
+                    db_session=db_session, series_ids=series_ids
+                )
+            }
+            if not force_tvdb_refresh:
+                cached_tvdb_data = await self.tvdb_cache.get_many(
+                    db_session=db_session,
+                    tvdb_ids=[ms.tvdb_id for ms in missing_seriess],
+                )
+
+        async with asyncio.TaskGroup() as tg:
+            fetch_tasks = [
+                tg.create_task(
+                    self._fetch_remote_data(
+                        missing_series=missing_series,
+                        tvdb_data=cached_tvdb_data.get(missing_series.tvdb_id),
+                        fetch_series_data=self._is_series_changed(
+                            show=existing_shows.get(missing_series.id),
+                            series_hash=series_hashes.get(missing_series.id),
+                        ),
                     )
+                )
+                for missing_series in missing_seriess
+            ]
+        fetched_tvdb_data = {
+            missing_series.tvdb_id: tvdb_data
+            for missing_series, tvdb_data, _ in (t.result() for t in fetch_tasks)
+            if missing_series.tvdb_id not in cached_tvdb_data
+        }
+
+        async with self.db_manager.begin_session() as db_session:
+            with db_session.no_autoflush:
+                await self.tvdb_cache.put_many(
+                    db_session=db_session, shows_data=fetched_tvdb_data
+                )
+                await self.shows_repository.unflag_all_missing_series(
+                    db_session, except_series_ids=series_ids
+                )
+                missing_shows: list[Show] = []
+                for fetch_task in fetch_tasks:
+                    missing_series, tvdb_data, series_data = fetch_task.result()
+                    series_hash = series_hashes.get(missing_series.id)
+
+                    show = existing_shows.get(missing_series.id)
                     if not show:
-                        show = await self._create_new_show(missing_series)
+                        show = self._create_new_show(
+                            missing_series, tvdb_data, series_data, series_hash
+                        )
+                        await self.shows_repository.save(
+                            db_session=db_session, show=show
+                        )
                     else:
-                        show = await self._update_show(show, missing_series)
+                        # Attach the show before updating it so that only the
+                        # actually changed columns get written
+                        await self.shows_repository.save(
+                            db_session=db_session, show=show
+                        )
+                        self._update_show(show, tvdb_data, series_data, series_hash)
 
                     show.is_missing = True
                     show.missing_seasons = missing_series.season_numbers
+                    missing_shows.append(show)
 
-                    await self.shows_repository.save(db_session=db_session, show=show)
+                await db_session.flush()
+                await self.shows_repository.update_missing_seasons(
+                    db_session=db_session,
+                    missing_seasons={
+                        show.id: show.missing_seasons for show in missing_shows
+                    },
+                )
 
-    async def _create_new_show(self, missing_series: MissingSeries) -> Show:
-        tvdb_data: TvdbShowData = await self.tvdb_client.get_series(
-            missing_series.tvdb_id
-        )
-        series_data: Series = await self.series_service.get_series(
-            series_id=missing_series.id
-        )
+    async def _fetch_remote_data(
+        self,
+        missing_series: MissingSeries,
+        tvdb_data: TvdbShowData | None,
+        fetch_series_data: bool,
+    ) -> tuple[MissingSeries, TvdbShowData, Series | None]:
+        if tvdb_data is None:
+            async with self._tvdb_semaphore:
+                tvdb_data = await self.tvdb_client.get_series(missing_series.tvdb_id)
+
+        series_data: Series | None = None
+        if fetch_series_data:
+            async with self._series_service_semaphore:
+                series_data = await self.series_service.get_series(
+                    series_id=missing_series.id
+                )
+        return missing_series, tvdb_data, series_data
+
+    @staticmethod
+    def _is_series_changed(show: Show | None, series_hash: str | None) -> bool:
+        if show is None or show.sonarr_data_hash is None:
+            return True
+        return show.sonarr_data_hash != series_hash
+
+    @staticmethod
+    def _create_new_show(
+        missing_series: MissingSeries,
+        tvdb_data: TvdbShowData,
+        series_data: Series,
+        series_hash: str | None,
+    ) -> Show:
         show = Show(
             sonarr_id=missing_series.id,
-            tvdb_data_raw=tvdb_data.model_dump_json(),
-            sonarr_data_raw=series_data.model_dump_json(),
+            tvdb_data_raw=tvdb_data.model_dump(mode="json"),
+            sonarr_data_raw=series_data.model_dump(mode="json"),
+            sonarr_data_hash=series_hash,
         )
         show.prowlarr_search = show.tvdb_data.title
         show.prowlarr_data_raw = None
 
         return show
 
-    async def _update_show(self, show: Show, missing_series: MissingSeries) -> None:
-        tvdb_data: TvdbShowData = await self.tvdb_client.get_series(
-            missing_series.tvdb_id
-        )
-        series_data: Series = await self.series_service.get_series(
-            series_id=missing_series.id
-        )
-        show.tvdb_data_raw = tvdb_data.model_dump_json()
-        show.sonarr_data_raw = series_data.model_dump_json()
+    @staticmethod
+    def _update_show(
+        show: Show,
+        tvdb_data: TvdbShowData,
+        series_data: Series | None,
+        series_hash: str | None,
+    ) -> Show:
+        show.tvdb_data_raw = tvdb_data.model_dump(mode="json")
+        if series_data is not None:
+            show.sonarr_data_raw = series_data.model_dump(mode="json")
+            show.sonarr_data_hash = series_hash
 
         return show
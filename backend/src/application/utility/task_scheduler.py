@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
 
 import loguru
 
@@ -16,9 +21,33 @@ from src.application.use_cases.releases.re_grab_outdated import (
 from src.application.use_cases.shows.sync_missing_series import (
     UseCase_SyncMissingSeries,
 )
+from src.metrics import MetricsRegistry
+
+
+@dataclass
+class TaskSchedule:
+    interval: int
+    jitter: int = 0
+    timeout: int | None = None
+
+
+@dataclass
+class _Task:
+    name: str
+    run: Callable[..., Awaitable[Any]]
+    schedule: TaskSchedule
+    dependents: list[_Task] = field(default_factory=list)
+    run_kwargs: dict[str, Any] = field(default_factory=dict)
+    lock: asyncio.Lock | None = None
+    is_dependent: bool = False
+    requested: asyncio.Event = field(default_factory=asyncio.Event)
+    delayed_trigger: asyncio.TimerHandle | None = None
 
 
 class TaskScheduler:
+    FAILED_TASK_RETRY_DELAY = 60
+    FAILED_EXPORT_RETRY_DELAY = 10
+
     def __init__(
         self,
         sync_missing_series: UseCase_SyncMissingSeries,
@@ -26,6 +55,11 @@ class TaskScheduler:
         export_finished_series: UseCase_ExportFinishedSeries,
         re_grab_outdated_releases: UseCase_ReGrabOutdatedReleases,
         logger: loguru.Logger,
+        metrics: MetricsRegistry,
+        sync_missing_series_schedule: TaskSchedule,
+        import_releases_torrent_stats_schedule: TaskSchedule,
+        export_finished_series_schedule: TaskSchedule,
+        re_grab_outdated_releases_schedule: TaskSchedule,
     ) -> None:
         self.sync_missing_series = sync_missing_series
         self.import_releases_torrent_stats = import_releases_torrent_stats
@@ -33,71 +67,194 @@ class TaskScheduler:
         self.re_grab_outdated_releases = re_grab_outdated_releases
         self.logger = logger
 
+        self._task_duration = metrics.histogram(
+            "releasarr_task_duration_seconds",
+            "Duration of scheduled task runs",
+            ("task", "status"),
+        )
+        self._task_failures = metrics.counter(
+            "releasarr_task_failures_total", "Failed scheduled task runs", ("task",)
+        )
+        self._task_last_success = metrics.gauge(
+            "releasarr_task_last_success_timestamp_seconds",
+            "Unix time of the last successful task run",
+            ("task",),
+        )
+        self._task_items = metrics.counter(
+            "releasarr_task_items_total",
+            "Items processed by scheduled tasks, by outcome",
+            ("task", "outcome"),
+        )
+
+        # Tasks writing releases load them in one session and save them in
+        # another, so they must not interleave
+        releases_lock = asyncio.Lock()
+
+        self._tasks: dict[str, _Task] = {}
+        self._add_task(
+            "sync_missing_series",
+            self.sync_missing_series.process,
+            sync_missing_series_schedule,
+        )
+        self._add_task(
+            "import_releases_torrent_stats",
+            self._import_releases_torrent_stats,
+            import_releases_torrent_stats_schedule,
+            lock=releases_lock,
+        )
+        self._add_task(
+            "export_finished_series",
+            self._export_finished_series,
+            export_finished_series_schedule,
+            run_after=["import_releases_torrent_stats"],
+            lock=releases_lock,
+        )
+        self._add_task(
+            "re_grab_outdated_releases",
+            self.re_grab_outdated_releases.process,
+            re_grab_outdated_releases_schedule,
+            run_after=["sync_missing_series"],
+            lock=releases_lock,
+        )
+
         self._stop = False
-        self._run_sync_task = False
         self._wait_tasks = []
-        self._cancel_tasks = []
+
+    def _add_task(
+        self,
+        name: str,
+        run: Callable[..., Awaitable[Any]],
+        schedule: TaskSchedule,
+        run_after: list[str] | None = None,
+        lock: asyncio.Lock | None = None,
+    ) -> None:
+        task = _Task(
+            name=name,
+            run=run,
+            schedule=schedule,
+            lock=lock,
+            is_dependent=bool(run_after),
+        )
+        for dependency_name in run_after or []:
+            self._tasks[dependency_name].dependents.append(task)
+        self._tasks[name] = task
 
     async def start(self) -> None:
         self.logger.info("Started")
 
         with self.logger.catch(reraise=True):
-            self._cancel_tasks.append(
-                asyncio.create_task(self.enable_sync_task_schedule())
-            )
-            self._wait_tasks.append(asyncio.create_task(self.start_sync_task()))
+            for task in self._tasks.values():
+                self._wait_tasks.append(asyncio.create_task(self._run_task_loop(task)))
+            self.trigger_all_tasks()
 
     async def stop(self) -> None:
         self.logger.info("Stopping")
         self._stop = True
-        for task in self._cancel_tasks:
-            task.cancel()
+        for task in self._tasks.values():
+            if task.delayed_trigger is not None:
+                task.delayed_trigger.cancel()
+            task.requested.set()
         with self.logger.catch(reraise=True):
             await asyncio.gather(*self._wait_tasks)
 
-    async def enable_sync_task_schedule(self):
+    def trigger_all_tasks(self) -> None:
+        # Dependent tasks are triggered once the tasks they depend on succeed
+        for task in self._tasks.values():
+            if not task.is_dependent:
+                self._trigger(task)
+
+    def trigger_task(self, name: str, after: int = 0, **run_kwargs: Any) -> None:
+        task = self._tasks[name]
+        task.run_kwargs.update(run_kwargs)
+        self._trigger(task, after=after)
+
+    async def _run_task_loop(self, task: _Task) -> None:
         while True:
-            self._run_sync_task = True
-            await asyncio.sleep(60 * 60)
+            timeout = task.schedule.interval + random.uniform(0, task.schedule.jitter)
+            try:
+                await asyncio.wait_for(task.requested.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+            if self._stop:
+                return
+
+            # Triggers received while the task is running are coalesced into
+            # a single rerun right after it
+            task.requested.clear()
+            run_kwargs, task.run_kwargs = task.run_kwargs, {}
+            await self._run_task(task, run_kwargs)
+
+    async def _run_task(self, task: _Task, run_kwargs: dict[str, Any]) -> None:
+        async with task.lock or contextlib.nullcontext():
+            await self._run_task_locked(task, run_kwargs)
 
-    async def start_sync_task(self):
-        while self._stop is False:
-            if not self._run_sync_task:
-                await asyncio.sleep(5)
-                continue
-            await self.sync_task()
+    async def _run_task_locked(self, task: _Task, run_kwargs: dict[str, Any]) -> None:
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                task.run(**run_kwargs), timeout=task.schedule.timeout
+            )
+        except Exception as e:
+            self._task_duration.observe(
+                time.perf_counter() - started_at,
+                task=task.name,
+                status="timeout" if isinstance(e, TimeoutError) else "error",
+            )
+            self._task_failures.inc(task=task.name)
+            self.logger.exception(f"Failed `{task.name}`")
+            # The retry keeps the arguments the failed run was requested with
+            task.run_kwargs = {**run_kwargs, **task.run_kwargs}
+            self._trigger(task, after=self.FAILED_TASK_RETRY_DELAY)
+            return
 
-    async def trigger_sync_task(self, after: int = 0):
+        self._task_duration.observe(
+            time.perf_counter() - started_at, task=task.name, status="success"
+        )
+        self._task_last_success.set(time.time(), task=task.name)
+        for dependent in task.dependents:
+            self._trigger(dependent)
+
+    def _trigger(self, task: _Task, after: int = 0) -> None:
         if after == 0:
-            self._run_sync_task = True
+            task.requested.set()
             return
 
-        async def _inner():
-            await asyncio.sleep(after)
-            self._run_sync_task = True
+        loop = asyncio.get_running_loop()
+        when = loop.time() + after
+        if task.delayed_trigger is not None and not task.delayed_trigger.cancelled():
+            if task.delayed_trigger.when() <= when:
+                return
+            task.delayed_trigger.cancel()
+        task.delayed_trigger = loop.call_at(when, self._fire_delayed_trigger, task)
 
-        asyncio.create_task(_inner())
+    @staticmethod
+    def _fire_delayed_trigger(task: _Task) -> None:
+        task.delayed_trigger = None
+        task.requested.set()
 
-    async def sync_task(self):
-        with self.logger.catch(reraise=True):
-            self.logger.info("Running full sync")
+    async def _import_releases_torrent_stats(self) -> None:
+        result = await self.import_releases_torrent_stats.process()
+        for outcome, count in (
+            ("updated", result.updated),
+            ("unchanged", result.unchanged),
+            ("not_found", result.not_found),
+        ):
+            self._task_items.inc(
+                count, task="import_releases_torrent_stats", outcome=outcome
+            )
 
-            try:
-                await self.sync_missing_series.process()
-                await self.import_releases_torrent_stats.process()
-                export_finished_series_result = (
-                    await self.export_finished_series.process()
-                )
-                if export_finished_series_result.failed > 0:
-                    self.logger.warning(
-                        f"We have {export_finished_series_result.failed} releases failed to export! "
-                        "Rescheduling the sync..."
-                    )
-                    self.trigger_sync_task(after=10)
-
-                await self.re_grab_outdated_releases.process()
-
-                self._run_sync_task = False
-                self.logger.info("Full sync finished")
-            except Exception:
-                self.logger.exception("Failed full sync")
+    async def _export_finished_series(self) -> None:
+        export_finished_series_result = await self.export_finished_series.process()
+        for outcome, count in (
+            ("succeeded", export_finished_series_result.succeded),
+            ("failed", export_finished_series_result.failed),
+        ):
+            self._task_items.inc(count, task="export_finished_series", outcome=outcome)
+        if export_finished_series_result.failed > 0:
+            self.logger.warning(
+                f"We have {export_finished_series_result.failed} releases failed to export! "
+                "Rescheduling the export..."
+            )
+            self.trigger_task(
+                "export_finished_series", after=self.FAILED_EXPORT_RETRY_DELAY
+            )
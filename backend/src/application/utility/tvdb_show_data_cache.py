@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.tvdb_cache_repository import I_TvdbCacheRepository
+from src.application.interfaces.tvdb_client import TvdbShowData
+from src.application.models import TvdbShowCache
+
+
+class TvdbShowDataCache:
+    def __init__(
+        self,
+        tvdb_cache_repository: I_TvdbCacheRepository,
+        ttl: timedelta,
+        max_memory_size: int,
+    ) -> None:
+        self.tvdb_cache_repository = tvdb_cache_repository
+        self.ttl = ttl
+        self.max_memory_size = max_memory_size
+        self._memory: OrderedDict[int, tuple[datetime, TvdbShowData]] = OrderedDict()
+
+    async def get_many(
+        self, db_session: AsyncSession, tvdb_ids: list[int]
+    ) -> dict[int, TvdbShowData]:
+        entries: dict[int, tuple[datetime, TvdbShowData]] = {}
+        not_in_memory_ids = []
+        for tvdb_id in tvdb_ids:
+            entry = self._memory.get(tvdb_id)
+            if entry is None:
+                not_in_memory_ids.append(tvdb_id)
+                continue
+            self._memory.move_to_end(tvdb_id)
+            entries[tvdb_id] = entry
+
+        if not_in_memory_ids:
+            for db_entry in await self.tvdb_cache_repository.get_many(
+                db_session=db_session, tvdb_ids=not_in_memory_ids
+            ):
+                entry = (db_entry.fetched_at, db_entry.data)
+                self._remember(db_entry.tvdb_id, entry)
+                entries[db_entry.tvdb_id] = entry
+
+        expire_before = datetime.now() - self.ttl
+        return {
+            tvdb_id: data
+            for tvdb_id, (fetched_at, data) in entries.items()
+            if fetched_at > expire_before
+        }
+
+    async def put_many(
+        self, db_session: AsyncSession, shows_data: dict[int, TvdbShowData]
+    ) -> None:
+        fetched_at = datetime.now()
+        for tvdb_id, data in shows_data.items():
+            await self.tvdb_cache_repository.save(
+                db_session=db_session,
+                entry=TvdbShowCache(
+                    tvdb_id=tvdb_id,
+                    data_raw=data.model_dump(mode="json"),
+                    fetched_at=fetched_at,
+                ),
+            )
+            self._remember(tvdb_id, (fetched_at, data))
+
+    def _remember(self, tvdb_id: int, entry: tuple[datetime, TvdbShowData]) -> None:
+        self._memory[tvdb_id] = entry
+        self._memory.move_to_end(tvdb_id)
+        while len(self._memory) > self.max_memory_size:
+            self._memory.popitem(last=False)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
+
+import httpx
 
 from src.application.interfaces.release_searcher import I_ReleaseSearcher
 from src.application.interfaces.releases_repository import I_ReleasesRepository
 from src.application.interfaces.series_service import I_SeriesService
 from src.application.interfaces.shows_repository import I_ShowsRepository
 from src.application.interfaces.torrent_client import I_TorrentClient
+from src.application.interfaces.tvdb_cache_repository import I_TvdbCacheRepository
 from src.application.interfaces.tvdb_client import I_TvdbClient
 from src.application.use_cases.releases.delete import UseCase_DeleteRelease
 from src.application.use_cases.releases.export_finished_series import (
@@ -29,19 +33,29 @@ from src.application.use_cases.shows.sync_missing_series import (
 from src.application.utility.release_files_matchings_autocompleter import (
     ReleaseFileMatchingsAutocompleter,
 )
-from src.application.utility.task_scheduler import TaskScheduler
+from src.application.utility.task_scheduler import TaskSchedule, TaskScheduler
+from src.application.utility.tvdb_show_data_cache import TvdbShowDataCache
 from src.db import get_async_sessionmaker
+from src.infrastructure.api_clients.http_client_factory import HttpClientFactory
 from src.infrastructure.api_clients.prowlarr import ProwlarrApiClient
 from src.infrastructure.api_clients.qbittorrent import QBittorrentApiClient
+from src.infrastructure.api_clients.resilient_transport import (
+    CircuitBreakerPolicy,
+    RetryPolicy,
+)
 from src.infrastructure.api_clients.sonarr import SonarrApiClient
 from src.infrastructure.api_clients.tvdb import TVDBApiClient
 from src.infrastructure.db_manager import DBManager
+from src.infrastructure.log_broadcaster import LogBroadcaster
+from src.infrastructure.queries.get_metrics import Query_GetMetrics
 from src.infrastructure.queries.get_show import Query_GetShow
 from src.infrastructure.queries.list_logs import Query_ListLogs
 from src.infrastructure.queries.list_shows import Query_ListShows
 from src.infrastructure.repositories.releases import ReleasesRepository
 from src.infrastructure.repositories.shows import ShowsRepository
+from src.infrastructure.repositories.tvdb_cache import TvdbCacheRepository
 from src.logger import logger
+from src.metrics import metrics
 from src.settings import app_settings
 
 
@@ -52,6 +66,7 @@ class Dependencies:
         list_shows: Query_ListShows
         get_show: Query_GetShow
         list_logs: Query_ListLogs
+        get_metrics: Query_GetMetrics
 
     @dataclass
     class UseCases:
@@ -68,6 +83,7 @@ class Dependencies:
     class Repositories:
         shows: I_ShowsRepository
         releases: I_ReleasesRepository
+        tvdb_cache: I_TvdbCacheRepository
 
     @dataclass
     class Services:
@@ -76,12 +92,14 @@ class Dependencies:
         tvdb_client: I_TvdbClient
         series_service: I_SeriesService
         release_files_matching_autocompleter: ReleaseFileMatchingsAutocompleter
+        tvdb_cache: TvdbShowDataCache
 
     queries: Queries
     use_cases: UseCases
     repositories: Repositories
     services: Services
     task_scheduler: TaskScheduler
+    log_broadcaster: LogBroadcaster
 
 
 def _init_dependencies() -> Dependencies:
@@ -91,26 +109,57 @@ def _init_dependencies() -> Dependencies:
     repositories = Dependencies.Repositories(
         shows=ShowsRepository(),
         releases=ReleasesRepository(),
+        tvdb_cache=TvdbCacheRepository(),
+    )
+
+    http_client_factory = HttpClientFactory(
+        metrics=metrics,
+        logger=logger.bind(component="HttpClient"),
+        slow_call_threshold=app_settings.HTTP_SLOW_CALL_THRESHOLD,
+        retry_policy=RetryPolicy(
+            max_retries=app_settings.HTTP_MAX_RETRIES,
+            backoff_base=app_settings.HTTP_RETRY_BACKOFF_BASE,
+            backoff_max=app_settings.HTTP_RETRY_BACKOFF_MAX,
+            max_retry_after=app_settings.HTTP_MAX_RETRY_AFTER,
+        ),
+        circuit_breaker_policy=CircuitBreakerPolicy(
+            failure_threshold=app_settings.HTTP_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=app_settings.HTTP_CIRCUIT_BREAKER_RESET_TIMEOUT,
+        ),
+        limits=httpx.Limits(
+            max_connections=app_settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=app_settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=app_settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
     )
 
     services = Dependencies.Services(
         release_searcher=ProwlarrApiClient(
             base_url=app_settings.PROWLARR_BASE_URL,
             api_token=app_settings.PROWLARR_API_TOKEN,
+            http_client_factory=http_client_factory,
         ),
         torrent_client=QBittorrentApiClient(
             base_url=app_settings.QBITTORRENT_BASE_URL,
             username=app_settings.QBITTORRENT_USERNAME,
             password=app_settings.QBITTORRENT_PASSWORD,
+            http_client_factory=http_client_factory,
         ),
         tvdb_client=TVDBApiClient(
             api_token=app_settings.TVDB_API_TOKEN,
+            http_client_factory=http_client_factory,
         ),
         series_service=SonarrApiClient(
             base_url=app_settings.SONARR_BASE_URL,
             api_token=app_settings.SONARR_API_TOKEN,
+            http_client_factory=http_client_factory,
         ),
         release_files_matching_autocompleter=ReleaseFileMatchingsAutocompleter(),
+        tvdb_cache=TvdbShowDataCache(
+            tvdb_cache_repository=repositories.tvdb_cache,
+            ttl=timedelta(hours=app_settings.TVDB_CACHE_TTL_HOURS),
+            max_memory_size=app_settings.TVDB_CACHE_MEMORY_SIZE,
+        ),
     )
 
     queries = Dependencies.Queries(
@@ -126,6 +175,11 @@ def _init_dependencies() -> Dependencies:
             log_file=app_settings.LOG_FILE,
             logger=logger.bind(component="Query.ListLogs"),
         ),
+        get_metrics=Query_GetMetrics(
+            db_manager=db_manager,
+            metrics=metrics,
+            logger=logger.bind(component="Query.GetMetrics"),
+        ),
     )
 
     use_cases = Dependencies.UseCases(
@@ -154,7 +208,10 @@ def _init_dependencies() -> Dependencies:
             series_service=services.series_service,
             shows_repository=repositories.shows,
             tvdb_client=services.tvdb_client,
+            tvdb_cache=services.tvdb_cache,
             logger=logger.bind(component="UseCase.SyncMissingSeries"),
+            series_service_concurrency=app_settings.SONARR_MAX_CONCURRENT_REQUESTS,
+            tvdb_concurrency=app_settings.TVDB_MAX_CONCURRENT_REQUESTS,
         ),
         import_releases_torrent_stats=UseCase_ImportReleasesTorrentStats(
             db_manager=db_manager,
@@ -175,6 +232,7 @@ def _init_dependencies() -> Dependencies:
             releases_repository=repositories.releases,
             release_files_matching_autocompleter=services.release_files_matching_autocompleter,
             logger=logger.bind(component="UseCase.ReGrabOutdatedReleases"),
+            indexer_concurrency=app_settings.PROWLARR_MAX_CONCURRENT_SEARCHES_PER_INDEXER,
         ),
         delete_release=UseCase_DeleteRelease(
             db_manager=db_manager,
@@ -189,6 +247,38 @@ def _init_dependencies() -> Dependencies:
         export_finished_series=use_cases.export_finished_series,
         re_grab_outdated_releases=use_cases.re_grab_outdated_releases,
         logger=logger.bind(component="TaskScheduler"),
+        metrics=metrics,
+        sync_missing_series_schedule=TaskSchedule(
+            interval=app_settings.TASK_SYNC_MISSING_SERIES_INTERVAL,
+            jitter=app_settings.TASK_SYNC_MISSING_SERIES_JITTER,
+            timeout=app_settings.TASK_SYNC_MISSING_SERIES_TIMEOUT,
+        ),
+        import_releases_torrent_stats_schedule=TaskSchedule(
+            interval=app_settings.TASK_IMPORT_TORRENT_STATS_INTERVAL,
+            jitter=app_settings.TASK_IMPORT_TORRENT_STATS_JITTER,
+            timeout=app_settings.TASK_IMPORT_TORRENT_STATS_TIMEOUT,
+        ),
+        export_finished_series_schedule=TaskSchedule(
+            interval=app_settings.TASK_EXPORT_FINISHED_SERIES_INTERVAL,
+            jitter=app_settings.TASK_EXPORT_FINISHED_SERIES_JITTER,
+            timeout=app_settings.TASK_EXPORT_FINISHED_SERIES_TIMEOUT,
+        ),
+        re_grab_outdated_releases_schedule=TaskSchedule(
+            interval=app_settings.TASK_RE_GRAB_OUTDATED_RELEASES_INTERVAL,
+            jitter=app_settings.TASK_RE_GRAB_OUTDATED_RELEASES_JITTER,
+            timeout=app_settings.TASK_RE_GRAB_OUTDATED_RELEASES_TIMEOUT,
+        ),
+    )
+
+    log_broadcaster = LogBroadcaster(
+        buffer_size=app_settings.LOG_STREAM_BUFFER_SIZE,
+        subscriber_queue_size=app_settings.LOG_STREAM_SUBSCRIBER_QUEUE_SIZE,
+    )
+    logger.add(
+        log_broadcaster.sink,
+        format="{message}",
+        level="INFO",
+        filter=lambda record: "component" in record["extra"],
     )
 
     return Dependencies(
@@ -197,6 +287,7 @@ def _init_dependencies() -> Dependencies:
         repositories=repositories,
         services=services,
         task_scheduler=task_scheduler,
+        log_broadcaster=log_broadcaster,
     )
 
 
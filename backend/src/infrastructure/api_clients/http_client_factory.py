@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import re
+import time
+
+import httpx
+import loguru
+
+from src.infrastructure.api_clients.resilient_transport import (
+    CircuitBreakerPolicy,
+    ResilientTransport,
+    RetryPolicy,
+)
+from src.metrics import MetricsRegistry
+
+_STARTED_AT_EXTENSION = "releasarr_started_at"
+_ID_SEGMENT_RE = re.compile(r"^\d+$")
+_HASH_SEGMENT_RE = re.compile(r"^[0-9a-fA-F]{32,64}$")
+
+
+class HttpClientFactory:
+    def __init__(
+        self,
+        metrics: MetricsRegistry,
+        logger: loguru.Logger,
+        slow_call_threshold: float,
+        retry_policy: RetryPolicy,
+        circuit_breaker_policy: CircuitBreakerPolicy,
+        limits: httpx.Limits,
+    ) -> None:
+        self.metrics = metrics
+        self.logger = logger
+        self.slow_call_threshold = slow_call_threshold
+        self.retry_policy = retry_policy
+        self.circuit_breaker_policy = circuit_breaker_policy
+        self.limits = limits
+
+        self._requests = metrics.counter(
+            "releasarr_upstream_requests_total",
+            "HTTP requests to upstream services",
+            ("upstream", "method", "endpoint", "status"),
+        )
+        self._duration = metrics.histogram(
+            "releasarr_upstream_request_duration_seconds",
+            "Duration of HTTP requests to upstream services, including the body",
+            ("upstream", "method", "endpoint"),
+        )
+        self._sent_bytes = metrics.counter(
+            "releasarr_upstream_sent_bytes_total",
+            "Request body bytes sent to upstream services",
+            ("upstream", "endpoint"),
+        )
+        self._received_bytes = metrics.counter(
+            "releasarr_upstream_received_bytes_total",
+            "Response body bytes received from upstream services",
+            ("upstream", "endpoint"),
+        )
+
+    def create(self, upstream: str, **kwargs) -> httpx.AsyncClient:
+        # Retries happen below the event hooks, so the metrics and the slow
+        # call log describe a request together with all of its retries
+        transport = ResilientTransport(
+            httpx.AsyncHTTPTransport(limits=self.limits),
+            upstream=upstream,
+            retry_policy=self.retry_policy,
+            circuit_breaker_policy=self.circuit_breaker_policy,
+            metrics=self.metrics,
+            logger=self.logger,
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            event_hooks={
+                "request": [self._on_request],
+                "response": [lambda response: self._on_response(upstream, response)],
+            },
+            **kwargs,
+        )
+
+    @staticmethod
+    async def _on_request(request: httpx.Request) -> None:
+        request.extensions[_STARTED_AT_EXTENSION] = time.perf_counter()
+
+    async def _on_response(self, upstream: str, response: httpx.Response) -> None:
+        # Clients read every body right after the hooks anyway, reading it here
+        # lets the duration and size cover the whole response
+        await response.aread()
+
+        request = response.request
+        elapsed = time.perf_counter() - request.extensions[_STARTED_AT_EXTENSION]
+        endpoint = _endpoint_template(request.url.path)
+        self._requests.inc(
+            upstream=upstream,
+            method=request.method,
+            endpoint=endpoint,
+            status=str(response.status_code),
+        )
+        self._duration.observe(
+            elapsed, upstream=upstream, method=request.method, endpoint=endpoint
+        )
+        self._sent_bytes.inc(
+            int(request.headers.get("Content-Length", 0)),
+            upstream=upstream,
+            endpoint=endpoint,
+        )
+        self._received_bytes.inc(
+            len(response.content), upstream=upstream, endpoint=endpoint
+        )
+
+        if elapsed >= self.slow_call_threshold:
+            # Bound instead of passed as kwargs, loguru would try to format the
+            # `{id}` placeholders of the endpoint otherwise
+            self.logger.bind(
+                upstream=upstream,
+                method=request.method,
+                endpoint=endpoint,
+                status=response.status_code,
+                elapsed=elapsed,
+                size=len(response.content),
+            ).warning(
+                f"Slow {upstream} call: {request.method} {endpoint} took {elapsed:.2f}s"
+            )
+
+
+def _endpoint_template(path: str) -> str:
+    # Ids and hashes in paths would turn every series or torrent into its own
+    # metric series
+    segments = []
+    for segment in path.split("/"):
+        if _ID_SEGMENT_RE.match(segment):
+            segment = "{id}"
+        elif _HASH_SEGMENT_RE.match(segment):
+            segment = "{hash}"
+        segments.append(segment)
+    return "/".join(segments)
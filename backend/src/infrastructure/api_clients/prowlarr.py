@@ -1,6 +1,5 @@
 from typing import Optional
 
-import httpx
 from torrentool.api import Torrent
 
 from src.application.interfaces.release_searcher import (
@@ -9,12 +8,16 @@ from src.application.interfaces.release_searcher import (
     SearchError,
 )
 from src.application.schemas import ReleaseData, TorrentFile, TorrentMeta
+from src.infrastructure.api_clients.http_client_factory import HttpClientFactory
 
 
 class ProwlarrApiClient(I_ReleaseSearcher):
-    def __init__(self, base_url: str, api_token: str) -> None:
+    def __init__(
+        self, base_url: str, api_token: str, http_client_factory: HttpClientFactory
+    ) -> None:
         self.base_url = base_url
-        self.client = httpx.AsyncClient(
+        self.client = http_client_factory.create(
+            "prowlarr",
             base_url=self.base_url,
             headers={"X-Api-Key": api_token},
         )
@@ -54,6 +57,7 @@ class ProwlarrApiClient(I_ReleaseSearcher):
                     seeders=release_data["seeders"],
                     leechers=release_data["leechers"],
                     download_url=release_data["downloadUrl"],
+                    publish_date=release_data.get("publishDate"),
                 )
             )
         result = sorted(result, key=lambda release: release.age)
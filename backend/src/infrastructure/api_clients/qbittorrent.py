@@ -1,9 +1,13 @@
+import asyncio
 from datetime import datetime
 from typing import Optional
 
 import httpx
 from pydantic import BaseModel, Field
 
+from src.application.interfaces.torrent_client import TorrentInfo
+from src.infrastructure.api_clients.http_client_factory import HttpClientFactory
+
 
 class QBittorrentStats(BaseModel):
     torrents: dict[str, "QBittorrentTorrentStats"] = Field(default_factory=lambda: {})
@@ -65,14 +69,15 @@ class QBittorrentTorrentStats(BaseModel):
         json_encoders = {datetime: lambda v: int(v.timestamp())}
 
 
-def _authenticate(func):
-    login_happened = False
+# Keeps `/torrents/info?hashes=...` URLs well under the common 8 KB limit
+_TORRENTS_INFO_HASHES_CHUNK_SIZE = 100
+
 
+def _authenticate(func):
     async def _wrapper(self: "QBittorrentApiClient", *args, **kwargs):
-        nonlocal login_happened
-        if not login_happened:
+        if not self._login_happened:
             await self.log_in()
-            login_happened = True
+            self._login_happened = True
 
         try:
             return await func(self, *args, **kwargs)
@@ -85,9 +90,18 @@ def _authenticate(func):
 
 
 class QBittorrentApiClient:
-    def __init__(self, base_url: str, username: str, password: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        http_client_factory: HttpClientFactory,
+    ) -> None:
         self.base_url = base_url
-        self.client = httpx.AsyncClient(base_url=self.base_url)
+        self.client = http_client_factory.create(
+            "qbittorrent",
+            base_url=self.base_url,
+        )
         self._username = username
         self._password = password
         self._login_happened = False
@@ -125,12 +139,53 @@ class QBittorrentApiClient:
         )
         res.raise_for_status()
 
+    async def add_torrent_and_wait(
+        self, raw_torrent: bytes, info_hash: str, timeout: float = 10
+    ) -> dict:
+        # Authenticated separately, so a re-login while polling doesn't add
+        # the torrent once more
+        await self.add_torrent(raw_torrent)
+        return await self._wait_for_torrent(info_hash, timeout)
+
+    @_authenticate
+    async def _wait_for_torrent(self, info_hash: str, timeout: float) -> dict:
+        # qBittorrent registers added torrents asynchronously and responds
+        # with 404 to the properties request until it's done
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.05
+        while True:
+            res = await self.client.get(
+                "/torrents/properties", params={"hash": info_hash}
+            )
+            if res.status_code != 404:
+                res.raise_for_status()
+                return res.json()
+            if loop.time() + delay > deadline:
+                raise TimeoutError(f"Torrent `{info_hash}` wasn't added in {timeout}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1)
+
     @_authenticate
     async def torrent_properties(self, hash):
         res = await self.client.get("/torrents/properties", params={"hash": hash})
         res.raise_for_status()
         return res.json()
 
+    @_authenticate
+    async def get_torrents_info(self, hashes: list[str]) -> dict[str, TorrentInfo]:
+        result = {}
+        for chunk_start in range(0, len(hashes), _TORRENTS_INFO_HASHES_CHUNK_SIZE):
+            chunk = hashes[chunk_start : chunk_start + _TORRENTS_INFO_HASHES_CHUNK_SIZE]
+            res = await self.client.get(
+                "/torrents/info", params={"hashes": "|".join(chunk)}
+            )
+            res.raise_for_status()
+            for torrent_data in res.json():
+                torrent_info = TorrentInfo.model_validate(torrent_data)
+                result[torrent_info.hash] = torrent_info
+        return result
+
     @_authenticate
     async def get_stats(self):
         res = await self.client.get("/sync/maindata")
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+import loguru
+
+from src.metrics import MetricsRegistry
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+# Only failures saying the upstream as a whole is down open the circuit, errors
+# of single slow or broken requests don't
+UNAVAILABLE_STATUS_CODES = {502, 503, 504}
+UNAVAILABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+@dataclass
+class RetryPolicy:
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10
+    max_retry_after: float = 60
+
+
+@dataclass
+class CircuitBreakerPolicy:
+    failure_threshold: int = 5
+    reset_timeout: float = 30
+
+
+class UpstreamUnavailableError(httpx.TransportError): ...
+
+
+class _CircuitBreaker:
+    def __init__(self, policy: CircuitBreakerPolicy) -> None:
+        self.policy = policy
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.policy.reset_timeout:
+            return False
+        # Half-open: a single trial request goes through, the following ones
+        # keep failing fast until it succeeds or another timeout passes
+        self._opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> bool:
+        self._failures += 1
+        if self._opened_at is None and self._failures < self.policy.failure_threshold:
+            return False
+        was_open = self.is_open
+        self._opened_at = time.monotonic()
+        return not was_open
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        upstream: str,
+        retry_policy: RetryPolicy,
+        circuit_breaker_policy: CircuitBreakerPolicy,
+        metrics: MetricsRegistry,
+        logger: loguru.Logger,
+    ) -> None:
+        self.transport = transport
+        self.upstream = upstream
+        self.retry_policy = retry_policy
+        self.logger = logger
+
+        self._circuit_breaker = _CircuitBreaker(circuit_breaker_policy)
+        self._retries = metrics.counter(
+            "releasarr_upstream_retries_total",
+            "Retried HTTP requests to upstream services",
+            ("upstream", "reason"),
+        )
+        self._errors = metrics.counter(
+            "releasarr_upstream_errors_total",
+            "HTTP requests to upstream services failed without a response",
+            ("upstream", "error"),
+        )
+        self._circuit_open = metrics.gauge(
+            "releasarr_upstream_circuit_open",
+            "Whether requests to the upstream service currently fail fast",
+            ("upstream",),
+        )
+        self._circuit_open.set(0, upstream=upstream)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._circuit_breaker.allow_request():
+            self._errors.inc(upstream=self.upstream, error="circuit_open")
+            raise UpstreamUnavailableError(
+                f"{self.upstream} is unavailable, failing fast", request=request
+            )
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                self._errors.inc(upstream=self.upstream, error=type(e).__name__)
+                if not isinstance(e, RETRYABLE_ERRORS) or not self._can_retry(
+                    request, attempt
+                ):
+                    if isinstance(e, UNAVAILABLE_ERRORS):
+                        self._record_failure()
+                    raise
+                delay = self._get_backoff(attempt)
+                reason = type(e).__name__
+            else:
+                delay = None
+                if response.status_code in RETRYABLE_STATUS_CODES and self._can_retry(
+                    request, attempt
+                ):
+                    delay = self._get_retry_after(response)
+                    if delay is None:
+                        delay = self._get_backoff(attempt)
+                    elif delay > self.retry_policy.max_retry_after:
+                        delay = None
+
+                if delay is None:
+                    # The circuit is updated once per request, with the
+                    # outcome of its last attempt
+                    if response.status_code in UNAVAILABLE_STATUS_CODES:
+                        self._record_failure()
+                    else:
+                        self._record_success()
+                    return response
+                reason = str(response.status_code)
+                await response.aclose()
+
+            attempt += 1
+            self._retries.inc(upstream=self.upstream, reason=reason)
+            self.logger.bind(
+                upstream=self.upstream, attempt=attempt, reason=reason, delay=delay
+            ).info(
+                f"Retrying {self.upstream} request {request.method} "
+                f"{request.url.path} in {delay:.2f}s ({reason})"
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def _can_retry(self, request: httpx.Request, attempt: int) -> bool:
+        return (
+            request.method in IDEMPOTENT_METHODS
+            and attempt < self.retry_policy.max_retries
+            and not self._circuit_breaker.is_open
+        )
+
+    def _get_backoff(self, attempt: int) -> float:
+        # Full jitter keeps clients that failed together from retrying together
+        return random.uniform(
+            0,
+            min(
+                self.retry_policy.backoff_max,
+                self.retry_policy.backoff_base * 2**attempt,
+            ),
+        )
+
+    @staticmethod
+    def _get_retry_after(response: httpx.Response) -> float | None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _record_success(self) -> None:
+        if self._circuit_breaker.is_open:
+            self.logger.info(f"{self.upstream} is available again")
+        self._circuit_breaker.record_success()
+        self._circuit_open.set(0, upstream=self.upstream)
+
+    def _record_failure(self) -> None:
+        if self._circuit_breaker.record_failure():
+            self.logger.warning(
+                f"{self.upstream} keeps failing, failing requests fast for "
+                f"{self._circuit_breaker.policy.reset_timeout}s"
+            )
+        self._circuit_open.set(
+            int(self._circuit_breaker.is_open), upstream=self.upstream
+        )
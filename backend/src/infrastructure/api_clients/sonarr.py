@@ -1,7 +1,15 @@
+import asyncio
+import hashlib
+import json
+import math
+from collections import defaultdict
+from typing import AsyncIterator
+
 import httpx
 
 from src.application.interfaces.series_service import (
     E_SeriesManualImportError,
+    E_SeriesServiceUnavailableError,
     Episode,
     I_SeriesService,
     MissingSeries,
@@ -9,77 +17,118 @@ from src.application.interfaces.series_service import (
     Series,
     SeriesImportFile,
 )
+from src.infrastructure.api_clients.http_client_factory import HttpClientFactory
+from src.infrastructure.api_clients.resilient_transport import RETRYABLE_STATUS_CODES
 
 
 class SonarrApiClient(I_SeriesService):
-    def __init__(self, base_url, api_token) -> None:
-        self.client = httpx.AsyncClient(
-            base_url=base_url, headers={"X-Api-Key": api_token}
+    def __init__(
+        self,
+        base_url,
+        api_token,
+        http_client_factory: HttpClientFactory,
+        missing_page_size: int = 250,
+        missing_pages_window: int = 4,
+    ) -> None:
+        self.client = http_client_factory.create(
+            "sonarr",
+            base_url=base_url,
+            headers={"X-Api-Key": api_token},
         )
+        self.missing_page_size = missing_page_size
+        self.missing_pages_window = missing_pages_window
 
     async def get_missing(self) -> list[MissingSeries]:
+        result_data: dict[int, MissingSeries] = {}
+
+        async for response_data in self._iter_missing_records():
+            for response_data_row in response_data:
+                key = response_data_row["seriesId"]
+                season_number = response_data_row["seasonNumber"]
+                existing_row = result_data.get(key)
+                if not existing_row:
+                    result_data[key] = MissingSeries(
+                        id=key,
+                        tvdb_id=response_data_row["series"]["tvdbId"],
+                        season_numbers=[season_number],
+                    )
+                elif season_number not in existing_row.season_numbers:
+                    existing_row.season_numbers = sorted(
+                        [*existing_row.season_numbers, season_number]
+                    )
+        return list(result_data.values())
+
+    async def _iter_missing_records(self) -> AsyncIterator[list[dict]]:
+        first_page = await self._get_missing_page(page=1)
+        yield first_page["records"]
+
+        pages_count = math.ceil(first_page["totalRecords"] / self.missing_page_size)
+        for window_start in range(2, pages_count + 1, self.missing_pages_window):
+            window_end = min(window_start + self.missing_pages_window, pages_count + 1)
+            pages = await asyncio.gather(
+                *[
+                    self._get_missing_page(page=page)
+                    for page in range(window_start, window_end)
+                ]
+            )
+            for page_data in pages:
+                yield page_data["records"]
+
+    async def _get_missing_page(self, page: int) -> dict:
         res = await self.client.get(
             "/wanted/missing",
             params={
-                "page": "1",
-                "pageSize": "1000",
+                "page": str(page),
+                "pageSize": str(self.missing_page_size),
                 "includeSeries": "true",
                 "includeImages": "false",
                 "monitored": "true",
             },
         )
-        response_data = res.json()["records"]
-        result_data = {}
-
-        for response_data_row in response_data:
-            key = response_data_row["seriesId"]
-            existing_row: MissingSeries = result_data.get(key)
-            if not existing_row:
-                result_data[key] = MissingSeries(
-                    id=key,
-                    tvdb_id=response_data_row["series"]["tvdbId"],
-                    season_numbers=[response_data_row["seasonNumber"]],
-                )
-            else:
-                existing_row.season_numbers = sorted(
-                    set(
-                        [
-                            *existing_row.season_numbers,
-                            response_data_row["seasonNumber"],
-                        ]
-                    )
-                )
-        return result_data.values()
+        res.raise_for_status()
+        return res.json()
+
+    async def get_series_hashes(self) -> dict[int, str]:
+        res = await self.client.get("series")
+        res.raise_for_status()
+        return {
+            series_data["id"]: hashlib.md5(
+                json.dumps(
+                    [series_data["seasons"], series_data.get("statistics")],
+                    sort_keys=True,
+                ).encode()
+            ).hexdigest()
+            for series_data in res.json()
+        }
 
     async def get_series(self, series_id) -> Series:
-        res = await self.client.get(
-            f"series/{series_id}",
-            params={"includeSeasonImages": "false"},
+        series_res, episodes_res = await asyncio.gather(
+            self.client.get(
+                f"series/{series_id}",
+                params={"includeSeasonImages": "false"},
+            ),
+            self.client.get("episode", params={"seriesId": series_id}),
         )
-        series_data = res.json()
-        seasons: list[Series] = []
-        for season_data in series_data["seasons"]:
-            episodes_data = (
-                await self.client.get(
-                    "episode",
-                    params={
-                        "seriesId": series_id,
-                        "seasonNumber": season_data["seasonNumber"],
-                    },
+        series_data = series_res.json()
+        episodes_data = episodes_res.json()
+
+        season_episodes: dict[int, list[Episode]] = defaultdict(list)
+        for episode_data in episodes_data:
+            season_episodes[episode_data["seasonNumber"]].append(
+                Episode(
+                    id=episode_data["id"],
+                    episode_number=episode_data["episodeNumber"],
                 )
-            ).json()
+            )
+
+        seasons: list[Season] = []
+        for season_data in series_data["seasons"]:
             seasons.append(
                 Season(
                     season_number=season_data["seasonNumber"],
                     episode_file_count=season_data["statistics"]["episodeFileCount"],
                     episode_count=season_data["statistics"]["episodeCount"],
-                    episodes=[
-                        Episode(
-                            id=episode_data["id"],
-                            episode_number=episode_data["episodeNumber"],
-                        )
-                        for episode_data in episodes_data
-                    ],
+                    episodes=season_episodes[season_data["seasonNumber"]],
                     total_episodes_count=season_data["statistics"]["totalEpisodeCount"],
                     previous_airing=season_data["statistics"].get("previousAiring"),
                 )
@@ -96,8 +145,14 @@ class SonarrApiClient(I_SeriesService):
             # TODO: it also fails for releases with 100+ files
             # await self._run_manual_import_check(import_files)
             await self._run_manual_import_command(import_files)
-        except Exception:
-            raise E_SeriesManualImportError
+        except httpx.TransportError as e:
+            raise E_SeriesServiceUnavailableError from e
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in RETRYABLE_STATUS_CODES:
+                raise E_SeriesServiceUnavailableError from e
+            raise E_SeriesManualImportError from e
+        except Exception as e:
+            raise E_SeriesManualImportError from e
 
     async def _run_manual_import_check(
         self, import_files: list[SeriesImportFile]
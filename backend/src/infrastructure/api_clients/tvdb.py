@@ -4,6 +4,7 @@ import httpx
 from pydantic import BaseModel
 
 from src.application.interfaces.tvdb_client import I_TvdbClient
+from src.infrastructure.api_clients.http_client_factory import HttpClientFactory
 
 
 class TvdbShowData(BaseModel):
@@ -47,10 +48,12 @@ class _Auth(httpx.Auth):
 
 
 class TVDBApiClient(I_TvdbClient):
-    def __init__(self, api_token: str) -> None:
+    def __init__(self, api_token: str, http_client_factory: HttpClientFactory) -> None:
         base_url = "https://api4.thetvdb.com/v4"
-        self.client = httpx.AsyncClient(
-            base_url=base_url, auth=_Auth(base_url=base_url, api_token=api_token)
+        self.client = http_client_factory.create(
+            "tvdb",
+            base_url=base_url,
+            auth=_Auth(base_url=base_url, api_token=api_token),
         )
 
     async def search(self, query: str):
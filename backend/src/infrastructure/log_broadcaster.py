@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import AsyncIterator
+
+import loguru
+
+from src.infrastructure.queries.list_logs import DTO_Logs_Record
+
+
+class LogBroadcaster:
+    def __init__(self, buffer_size: int, subscriber_queue_size: int) -> None:
+        self.subscriber_queue_size = subscriber_queue_size
+
+        self._buffer: deque[DTO_Logs_Record] = deque(maxlen=buffer_size)
+        self._subscribers: set[asyncio.Queue[DTO_Logs_Record]] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def sink(self, message: loguru.Message) -> None:
+        component = message.record["extra"].get("component")
+        if not isinstance(component, str):
+            return
+        record = DTO_Logs_Record(
+            time=str(message.record["time"]),
+            level=message.record["level"].name,
+            component=component,
+            message=message.record["message"],
+        )
+        # Loguru may call the sink from any thread, so records are published
+        # from the event loop the subscribers live in
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._publish, record)
+                return
+            except RuntimeError:
+                self._loop = None
+        self._buffer.append(record)
+
+    async def subscribe(
+        self, replay: bool = True, keepalive_interval: float = 15
+    ) -> AsyncIterator[DTO_Logs_Record | None]:
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[DTO_Logs_Record] = asyncio.Queue(
+            maxsize=self.subscriber_queue_size
+        )
+        backlog = list(self._buffer) if replay else []
+        self._subscribers.add(queue)
+        try:
+            for record in backlog:
+                yield record
+            while True:
+                try:
+                    yield await asyncio.wait_for(
+                        queue.get(), timeout=keepalive_interval
+                    )
+                except TimeoutError:
+                    yield None
+        finally:
+            self._subscribers.discard(queue)
+
+    def _publish(self, record: DTO_Logs_Record) -> None:
+        self._buffer.append(record)
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(record)
+            except asyncio.QueueFull:
+                # Slow clients miss records instead of holding up the others
+                pass
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import loguru
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.db_manager import I_DBManager
+from src.application.models import Release, Show
+from src.infrastructure.repositories.releases import finished_not_uploaded_filter
+from src.metrics import MetricsRegistry
+
+
+class Query_GetMetrics:
+    def __init__(
+        self,
+        db_manager: I_DBManager,
+        metrics: MetricsRegistry,
+        logger: loguru.Logger,
+    ) -> None:
+        self.db_manager = db_manager
+        self.metrics = metrics
+        self.logger = logger
+
+        self._missing_shows = metrics.gauge(
+            "releasarr_missing_shows", "Shows with missing seasons in Sonarr"
+        )
+        self._releases = metrics.gauge(
+            "releasarr_releases", "Grabbed releases by torrent state", ("finished",)
+        )
+        self._releases_pending_export = metrics.gauge(
+            "releasarr_releases_pending_export",
+            "Finished releases not exported to Sonarr yet",
+        )
+
+    async def execute(self) -> str:
+        with self.logger.catch(reraise=True):
+            async with self.db_manager.begin_session() as db_session:
+                await self._update_gauges(db_session)
+            return self.metrics.render()
+
+    async def _update_gauges(self, db_session: AsyncSession) -> None:
+        self._missing_shows.set(
+            await db_session.scalar(
+                select(func.count()).select_from(Show).where(Show.is_missing)
+            )
+        )
+
+        releases_by_state = dict(
+            (
+                await db_session.execute(
+                    select(Release.torrent_is_finished, func.count()).group_by(
+                        Release.torrent_is_finished
+                    )
+                )
+            ).all()
+        )
+        for finished in (True, False):
+            self._releases.set(
+                releases_by_state.get(finished, 0), finished=str(finished).lower()
+            )
+
+        self._releases_pending_export.set(
+            await db_session.scalar(
+                select(func.count())
+                .select_from(Release)
+                .where(finished_not_uploaded_filter)
+            )
+        )
@@ -6,7 +6,7 @@ import loguru
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import defer, selectinload
 
 from src.application.interfaces.db_manager import I_DBManager
 from src.application.models import Release, Show
@@ -136,7 +136,12 @@ class Query_GetShow:
             select(Show)
             .where(Show.id == show_id)
             .options(
-                joinedload(Show.releases).options(joinedload(Release.file_matchings)),
+                selectinload(Show.releases).options(
+                    defer(Release.prowlarr_data_raw),
+                    defer(Release.qbittorrent_data),
+                    defer(Release.torrent_stats_raw),
+                    selectinload(Release.file_matchings),
+                ),
             )
         )
         res = await db_session.scalar(q)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+from typing import BinaryIO, Iterator
 
 import loguru
 from pydantic import BaseModel
@@ -15,9 +18,13 @@ class DTO_Logs_Record(BaseModel):
 
 class DTO_Logs(BaseModel):
     records: list[DTO_Logs_Record]
+    next_before: int | None = None
 
 
 class Query_ListLogs:
+    READ_BLOCK_SIZE = 64 * 1024
+    MAX_SCANNED_LINES = 10_000
+
     def __init__(
         self,
         log_file: str,
@@ -26,24 +33,101 @@ class Query_ListLogs:
         self.log_file = log_file
         self.logger = logger
 
-    async def execute(self) -> DTO_Logs:
-        self.logger.info("List logs")
+    async def execute(
+        self,
+        limit: int = 100,
+        before: int | None = None,
+        level: str | None = None,
+        component: str | None = None,
+    ) -> DTO_Logs:
+        self.logger.info(
+            "List logs",
+            limit=limit,
+            before=before,
+            level_filter=level,
+            component_filter=component,
+        )
         with self.logger.catch(reraise=True):
-            return await self._execute()
+            return await self._execute(limit, before, level, component)
+
+    async def _execute(
+        self,
+        limit: int,
+        before: int | None,
+        level: str | None,
+        component: str | None,
+    ) -> DTO_Logs:
+        return await asyncio.to_thread(self._read_logs, limit, before, level, component)
 
-    async def _execute(self) -> DTO_Logs:
+    def _read_logs(
+        self,
+        limit: int,
+        before: int | None,
+        level: str | None,
+        component: str | None,
+    ) -> DTO_Logs:
         records = []
-        with open(self.log_file, "r") as file:
-            lines = file.readlines()[-100:]
-            lines.reverse()
-            for line in lines:
-                log_entry = json.loads(line)
-                records.append(
-                    DTO_Logs_Record(
-                        time=log_entry["record"]["time"]["repr"],
-                        level=log_entry["record"]["level"]["name"],
-                        component=log_entry["record"]["extra"]["component"],
-                        message=log_entry["text"],
-                    )
+        try:
+            file = open(self.log_file, "rb")
+        except FileNotFoundError:
+            return DTO_Logs(records=records)
+
+        # `before` is the file offset where the previous page stopped reading,
+        # so the next page continues with the lines right above it
+        with file:
+            for scanned_count, (offset, line) in enumerate(
+                self._iter_lines_reversed(file, before)
+            ):
+                if len(records) == limit or scanned_count == self.MAX_SCANNED_LINES:
+                    return DTO_Logs(records=records, next_before=offset + len(line) + 1)
+
+                try:
+                    log_entry = json.loads(line)
+                except ValueError:
+                    # The newest line may be still being written
+                    continue
+                entry_component = log_entry["record"]["extra"].get("component")
+                if not isinstance(entry_component, str):
+                    continue
+                record = DTO_Logs_Record(
+                    time=log_entry["record"]["time"]["repr"],
+                    level=log_entry["record"]["level"]["name"],
+                    component=entry_component,
+                    message=log_entry["text"],
                 )
+                if level is not None and record.level.lower() != level.lower():
+                    continue
+                if component is not None and record.component != component:
+                    continue
+                records.append(record)
+
         return DTO_Logs(records=records)
+
+    def _iter_lines_reversed(
+        self, file: BinaryIO, end: int | None
+    ) -> Iterator[tuple[int, bytes]]:
+        position = file.seek(0, os.SEEK_END)
+        if end is not None:
+            position = min(position, end)
+
+        head = b""
+        while position > 0:
+            read_size = min(self.READ_BLOCK_SIZE, position)
+            position -= read_size
+            file.seek(position)
+            chunk = file.read(read_size) + head
+
+            # Everything after the first newline consists of complete lines,
+            # the part before it is kept until the previous block is read
+            line_end = len(chunk)
+            newline_index = chunk.rfind(b"\n", 0, line_end)
+            while newline_index != -1:
+                line = chunk[newline_index + 1 : line_end]
+                if line:
+                    yield position + newline_index + 1, line
+                line_end = newline_index
+                newline_index = chunk.rfind(b"\n", 0, line_end)
+            head = chunk[:line_end]
+
+        if head:
+            yield 0, head
@@ -1,11 +1,36 @@
 from __future__ import annotations
 
+import base64
+import json
+from typing import Literal
+
 import loguru
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.interfaces.db_manager import I_DBManager
-from src.application.models import Show
+from src.application.models import Release, Show
+
+ShowsSortBy = Literal["id", "title", "year"]
+
+
+class DTO_ShowListItem(BaseModel):
+    id: int
+    title: str
+    year: int | None
+    image_url: str | None
+    is_missing: bool
+    missing_seasons: list[int]
+    releases_count: int
+
+
+class DTO_ShowList(BaseModel):
+    items: list[DTO_ShowListItem]
+    next_cursor: str | None
+
+
+class InvalidCursorError(Exception): ...
 
 
 class Query_ListShows:
@@ -17,21 +42,141 @@ class Query_ListShows:
         self.db_manager = db_manager
         self.logger = logger
 
-    async def execute(self, only_missing: bool) -> list[Show]:
+    async def execute(
+        self,
+        only_missing: bool,
+        search: str | None = None,
+        sort_by: ShowsSortBy = "id",
+        descending: bool = False,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> DTO_ShowList:
         self.logger.info(
             "List shows",
             only_missing=only_missing,
+            search=search,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            cursor=cursor,
         )
-        with self.logger.catch(reraise=True):
+        with self.logger.catch(reraise=True, exclude=InvalidCursorError):
             async with self.db_manager.begin_session() as db_session:
-                return await self._execute(db_session, only_missing)
+                return await self._execute(
+                    db_session, only_missing, search, sort_by, descending, limit, cursor
+                )
 
     async def _execute(
-        self, db_session: AsyncSession, only_missing: bool
-    ) -> list[Show]:
-        q = select(Show)
+        self,
+        db_session: AsyncSession,
+        only_missing: bool,
+        search: str | None,
+        sort_by: ShowsSortBy,
+        descending: bool,
+        limit: int,
+        cursor: str | None,
+    ) -> DTO_ShowList:
+        title = Show.tvdb_data_raw["title"].as_string()
+        year = Show.tvdb_data_raw["year"].as_integer()
+        sort_key = {
+            "id": Show.id,
+            "title": title,
+            "year": func.coalesce(year, 0),
+        }[sort_by]
+        releases_count = (
+            select(func.count())
+            .where(Release.show_id == Show.id)
+            .correlate(Show)
+            .scalar_subquery()
+        )
+
+        q = select(
+            Show.id,
+            title,
+            year,
+            Show.tvdb_data_raw["image_url"].as_string(),
+            Show.is_missing,
+            Show.missing_seasons,
+            releases_count,
+            sort_key,
+        )
 
         if only_missing:
             q = q.where(Show.is_missing)
+        if search:
+            q = q.where(title.icontains(search, autoescape=True))
+
+        # Keyset pagination: the cursor holds the sort key and id of the last
+        # returned show, the id breaks ties between equal sort keys
+        if cursor is not None:
+            last_sort_value, last_id = self._decode_cursor(cursor, sort_by, descending)
+            position = tuple_(sort_key, Show.id)
+            last_position = tuple_(last_sort_value, last_id)
+            q = q.where(
+                position < last_position if descending else position > last_position
+            )
+
+        if descending:
+            q = q.order_by(sort_key.desc(), Show.id.desc())
+        else:
+            q = q.order_by(sort_key, Show.id)
+
+        rows = (await db_session.execute(q.limit(limit + 1))).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(
+                sort_by, descending, rows[-1][-1], rows[-1][0]
+            )
+
+        return DTO_ShowList(
+            items=[
+                DTO_ShowListItem(
+                    id=show_id,
+                    title=show_title,
+                    year=show_year,
+                    image_url=image_url,
+                    is_missing=is_missing,
+                    missing_seasons=sorted(missing_seasons or []),
+                    releases_count=show_releases_count,
+                )
+                for (
+                    show_id,
+                    show_title,
+                    show_year,
+                    image_url,
+                    is_missing,
+                    missing_seasons,
+                    show_releases_count,
+                    _,
+                ) in rows
+            ],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _encode_cursor(
+        sort_by: ShowsSortBy, descending: bool, sort_value: int | str, show_id: int
+    ) -> str:
+        return base64.urlsafe_b64encode(
+            json.dumps([sort_by, descending, sort_value, show_id]).encode()
+        ).decode()
 
-        return await db_session.scalars(q)
+    @staticmethod
+    def _decode_cursor(
+        cursor: str, sort_by: ShowsSortBy, descending: bool
+    ) -> tuple[int | str, int]:
+        try:
+            cursor_sort_by, cursor_descending, sort_value, show_id = json.loads(
+                base64.urlsafe_b64decode(cursor)
+            )
+        except (ValueError, TypeError) as e:
+            raise InvalidCursorError(cursor) from e
+        # A cursor only points into the ordering it was issued for
+        if cursor_sort_by != sort_by or cursor_descending != descending:
+            raise InvalidCursorError(cursor)
+        expected_type = str if sort_by == "title" else int
+        if not isinstance(sort_value, expected_type) or not isinstance(show_id, int):
+            raise InvalidCursorError(cursor)
+        return sort_value, show_id
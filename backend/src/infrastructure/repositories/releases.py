@@ -1,9 +1,28 @@
-from sqlalchemy import delete, select
+from sqlalchemy import and_, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import defer, joinedload, selectinload
 
-from src.application.interfaces.releases_repository import I_ReleasesRepository
-from src.application.models import Release, ReleaseFileMatching, Show
+from src.application.interfaces.releases_repository import (
+    DTO_ReleaseTorrentStatsUpdate,
+    I_ReleasesRepository,
+)
+from src.application.models import (
+    Release,
+    ReleaseFileMatching,
+    Show,
+    ShowMissingSeason,
+)
+
+MAX_EXPORT_FAILURES = 5
+
+finished_not_uploaded_filter = and_(
+    Release.torrent_is_finished.is_(True),
+    (
+        (Release.qbittorrent_guid != Release.last_exported_torrent_guid)
+        | Release.last_exported_torrent_guid.is_(None)
+    ),
+    Release.export_failures_count < MAX_EXPORT_FAILURES,
+)
 
 
 class ReleasesRepository(I_ReleasesRepository):
@@ -17,7 +36,7 @@ class ReleasesRepository(I_ReleasesRepository):
         return await db_session.scalar(
             select(Release)
             .where(Release.name == name)
-            .options(joinedload(Release.file_matchings))
+            .options(selectinload(Release.file_matchings))
         )
 
     async def update_file_matchings(
@@ -25,6 +44,27 @@ class ReleasesRepository(I_ReleasesRepository):
     ) -> None:
         db_session.add_all(file_matchings)
 
+    async def get_all(self, db_session: AsyncSession) -> list[Release]:
+        return list(
+            await db_session.scalars(
+                select(Release).options(
+                    defer(Release.prowlarr_data_raw),
+                    defer(Release.qbittorrent_data),
+                    defer(Release.torrent_stats_raw),
+                )
+            )
+        )
+
+    async def bulk_update_torrent_stats(
+        self, db_session: AsyncSession, updates: list[DTO_ReleaseTorrentStatsUpdate]
+    ) -> int:
+        if not updates:
+            return 0
+        await db_session.execute(
+            update(Release), [release_update.model_dump() for release_update in updates]
+        )
+        return len(updates)
+
     async def get_by_torrent_hashes(
         self, db_session: AsyncSession, torrent_hashes: list[str]
     ) -> list[Release]:
@@ -35,41 +75,45 @@ class ReleasesRepository(I_ReleasesRepository):
     async def get_finished_not_uploaded(
         self, db_session: AsyncSession
     ) -> list[Release]:
-        res = await db_session.scalars(
-            select(Release)
-            .where(
-                Release.torrent_is_finished.is_(True),
-                (
-                    (Release.qbittorrent_guid != Release.last_exported_torrent_guid)
-                    | Release.last_exported_torrent_guid.is_(None)
-                ),
-                Release.export_failures_count < 5,
+        return list(
+            await db_session.scalars(
+                select(Release)
+                .where(finished_not_uploaded_filter)
+                .options(
+                    defer(Release.prowlarr_data_raw),
+                    defer(Release.torrent_stats_raw),
+                    selectinload(Release.file_matchings),
+                    joinedload(Release.show).options(
+                        defer(Show.tvdb_data_raw), defer(Show.prowlarr_data_raw)
+                    ),
+                )
             )
-            .options(joinedload(Release.file_matchings), joinedload(Release.show))
         )
-        return res.unique()
 
     async def get_outdated_releases(self, db_session: AsyncSession) -> list[Release]:
-        missing_shows: list[Show] = (
+        outdated_release_names = (
+            select(Release.name)
+            .join(Release.file_matchings)
+            .join(
+                ShowMissingSeason,
+                and_(
+                    ShowMissingSeason.show_id == Release.show_id,
+                    ShowMissingSeason.season_number
+                    == ReleaseFileMatching.season_number,
+                ),
+            )
+            .distinct()
+        )
+        return list(
             await db_session.scalars(
-                select(Show)
+                select(Release)
+                .where(Release.name.in_(outdated_release_names))
                 .options(
-                    joinedload(Show.releases).options(
-                        joinedload(Release.file_matchings),
-                    ),
+                    defer(Release.torrent_stats_raw),
+                    selectinload(Release.file_matchings),
                 )
-                .where(Show.is_missing)
             )
-        ).unique()
-        res = []
-        for missing_show in missing_shows:
-            for release in missing_show.releases:
-                for matching in release.file_matchings:
-                    if matching.season_number in missing_show.missing_seasons:
-                        res.append(release)
-                        break
-
-        return res
+        )
 
     async def delete(self, db_session, name):
         release = await db_session.scalar(select(Release).where(Release.name == name))
@@ -1,11 +1,9 @@
-import json
-
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import defer, selectinload
 
 from src.application.interfaces.shows_repository import I_ShowsRepository
-from src.application.models import Release, Show
+from src.application.models import Release, Show, ShowMissingSeason
 from src.application.schemas import ReleaseData
 
 
@@ -17,13 +15,24 @@ class ShowsRepository(I_ShowsRepository):
             select(Show)
             .where(Show.id == show_id)
             .options(
-                joinedload(Show.releases).options(joinedload(Release.file_matchings)),
+                selectinload(Show.releases).options(
+                    defer(Release.prowlarr_data_raw),
+                    defer(Release.torrent_stats_raw),
+                    selectinload(Release.file_matchings),
+                ),
             )
         )
 
     async def get_series(self, db_session: AsyncSession, series_id: int) -> Show | None:
         return await db_session.scalar(select(Show).where(Show.sonarr_id == series_id))
 
+    async def get_many_by_series_ids(
+        self, db_session: AsyncSession, series_ids: list[int]
+    ) -> list[Show]:
+        return list(
+            await db_session.scalars(select(Show).where(Show.sonarr_id.in_(series_ids)))
+        )
+
     async def save_releases_seach_results(
         self,
         db_session: AsyncSession,
@@ -36,18 +45,18 @@ class ShowsRepository(I_ShowsRepository):
             .values(
                 {
                     Show.prowlarr_search: search_string,
-                    Show.prowlarr_data_raw: json.dumps(
-                        [
-                            release.model_dump_json()
-                            for release in releases_search_result
-                        ]
-                    ),
+                    Show.prowlarr_data_raw: [
+                        release.model_dump(mode="json")
+                        for release in releases_search_result
+                    ],
                 }
             )
             .where(Show.id == show_id)
         )
 
-    async def unflag_all_missing_series(self, db_session: AsyncSession) -> None:
+    async def unflag_all_missing_series(
+        self, db_session: AsyncSession, except_series_ids: list[int] | None = None
+    ) -> None:
         await db_session.execute(
             update(Show)
             .values(
@@ -56,7 +65,40 @@ class ShowsRepository(I_ShowsRepository):
                     Show.missing_seasons: None,
                 }
             )
-            .where(Show.sonarr_id.is_not(None))
+            .where(
+                Show.sonarr_id.is_not(None),
+                Show.sonarr_id.not_in(except_series_ids or []),
+            )
+        )
+
+    async def update_missing_seasons(
+        self, db_session: AsyncSession, missing_seasons: dict[int, list[int]]
+    ) -> None:
+        existing_rows = set(
+            (
+                await db_session.execute(
+                    select(ShowMissingSeason.show_id, ShowMissingSeason.season_number)
+                )
+            ).tuples()
+        )
+        actual_rows = {
+            (show_id, season_number)
+            for show_id, season_numbers in missing_seasons.items()
+            for season_number in season_numbers
+        }
+
+        removed_rows = existing_rows - actual_rows
+        if removed_rows:
+            await db_session.execute(
+                delete(ShowMissingSeason).where(
+                    tuple_(
+                        ShowMissingSeason.show_id, ShowMissingSeason.season_number
+                    ).in_(removed_rows)
+                )
+            )
+        db_session.add_all(
+            ShowMissingSeason(show_id=show_id, season_number=season_number)
+            for show_id, season_number in actual_rows - existing_rows
         )
 
     async def save(self, db_session: AsyncSession, show: Show) -> None:
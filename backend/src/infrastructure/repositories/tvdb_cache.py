@@ -0,0 +1,19 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.tvdb_cache_repository import I_TvdbCacheRepository
+from src.application.models import TvdbShowCache
+
+
+class TvdbCacheRepository(I_TvdbCacheRepository):
+    async def get_many(
+        self, db_session: AsyncSession, tvdb_ids: list[int]
+    ) -> list[TvdbShowCache]:
+        return list(
+            await db_session.scalars(
+                select(TvdbShowCache).where(TvdbShowCache.tvdb_id.in_(tvdb_ids))
+            )
+        )
+
+    async def save(self, db_session: AsyncSession, entry: TvdbShowCache) -> None:
+        await db_session.merge(entry)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import inspect
 import logging
 import sys
 
@@ -11,15 +10,36 @@ from src.settings import app_settings
 
 
 class InterceptHandler(logging.Handler):
+    def __init__(self, level: int | str = 0) -> None:
+        super().__init__(level)
+        self._levels: dict[str, str | int] = {}
+        self._depths: dict[tuple[str, int], int] = {}
+
     def emit(self, record: logging.LogRecord) -> None:
         # Get corresponding Loguru level if it exists.
-        try:
-            level: str | int = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        level = self._levels.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._levels[record.levelname] = level
+
+        # The stack between the logging call and this handler is the same for
+        # every record emitted from a given line, so it is walked only once.
+        key = (record.pathname, record.lineno)
+        depth = self._depths.get(key)
+        if depth is None:
+            depth = self._depths[key] = self._find_caller_depth()
+
+        logger.opt(depth=depth, exception=record.exc_info).log(
+            level, record.getMessage()
+        )
 
+    @staticmethod
+    def _find_caller_depth() -> int:
         # Find caller from where originated the logged message.
-        frame, depth = inspect.currentframe(), 0
+        frame, depth = sys._getframe(1), 0
         while frame:
             filename = frame.f_code.co_filename
             is_logging = filename == logging.__file__
@@ -28,10 +48,7 @@ class InterceptHandler(logging.Handler):
                 break
             frame = frame.f_back
             depth += 1
-
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level, record.getMessage()
-        )
+        return depth
 
 
 def _init_logger() -> loguru.Logger:
@@ -44,6 +61,7 @@ def _init_logger() -> loguru.Logger:
         format="{time} | <lvl>{level}</lvl> | {name} | {message}",
         level="INFO",
         colorize=True,
+        enqueue=app_settings.LOG_ENQUEUE,
     )
     logger.add(
         app_settings.LOG_FILE,
@@ -53,6 +71,7 @@ def _init_logger() -> loguru.Logger:
         retention="10 days",
         filter=lambda record: "component" in record["extra"],
         serialize=True,
+        enqueue=app_settings.LOG_ENQUEUE,
     )
     return logger
 
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import math
+from typing import Iterator
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    300,
+    900,
+    1800,
+)
+
+
+class _Metric:
+    type: str
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type}"
+        yield from self._render_samples()
+
+    def _render_samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def _label_values(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[label_name]) for label_name in self.label_names)
+
+    def _format_labels(self, label_values: tuple[str, ...], **extra: str) -> str:
+        pairs = [*zip(self.label_names, label_values), *extra.items()]
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def _render_samples(self) -> Iterator[str]:
+        for label_values, value in self._values.items():
+            yield f"{self.name}{self._format_labels(label_values)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._label_values(labels)] = value
+
+    def _render_samples(self) -> Iterator[str]:
+        for label_values, value in self._values.items():
+            yield f"{self.name}{self._format_labels(label_values)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = (*sorted(buckets), math.inf)
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        counts = self._counts.setdefault(label_values, [0] * len(self.buckets))
+        for i, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                counts[i] += 1
+                break
+        self._sums[label_values] = self._sums.get(label_values, 0) + value
+
+    def _render_samples(self) -> Iterator[str]:
+        for label_values, counts in self._counts.items():
+            cumulative_count = 0
+            for upper_bound, count in zip(self.buckets, counts):
+                cumulative_count += count
+                labels = self._format_labels(
+                    label_values, le=_format_value(upper_bound)
+                )
+                yield f"{self.name}_bucket{labels} {cumulative_count}"
+            labels = self._format_labels(label_values)
+            yield f"{self.name}_sum{labels} {_format_value(self._sums[label_values])}"
+            yield f"{self.name}_count{labels} {cumulative_count}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Counter:
+        return self._get_or_create(Counter, name, documentation, label_names)
+
+    def gauge(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, label_names, buckets=buckets
+        )
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, metric_type, name, documentation, label_names, **kwargs):
+        # Clients of the same kind share metrics and tell them apart by labels
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = metric_type(
+                name, documentation, label_names, **kwargs
+            )
+        elif not isinstance(metric, metric_type) or metric.label_names != label_names:
+            raise ValueError(f"Metric `{name}` is already registered differently")
+        return metric
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+metrics = MetricsRegistry()
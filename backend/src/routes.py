@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from src.application.models import Show
 from src.application.use_cases.releases.update_files_matching import (
@@ -7,15 +8,35 @@ from src.application.use_cases.releases.update_files_matching import (
 from src.dependencies import dependencies
 from src.infrastructure.queries.get_show import DTO_Show
 from src.infrastructure.queries.list_logs import DTO_Logs
+from src.infrastructure.queries.list_shows import (
+    DTO_ShowList,
+    InvalidCursorError,
+    ShowsSortBy,
+)
 
 api_router = APIRouter()
 
 
 @api_router.get("/shows/")
-async def get_shows(only_missing: bool) -> list[Show]:
-    return await dependencies.queries.list_shows.execute(
-        only_missing=only_missing,
-    )
+async def get_shows(
+    only_missing: bool = False,
+    search: str | None = None,
+    sort_by: ShowsSortBy = "id",
+    descending: bool = False,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+) -> DTO_ShowList:
+    try:
+        return await dependencies.queries.list_shows.execute(
+            only_missing=only_missing,
+            search=search,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            cursor=cursor,
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @api_router.get("/shows/{show_id}", response_model=DTO_Show)
@@ -59,11 +80,54 @@ async def delete_release(show_id: int, release_name: str):
 
 
 @api_router.get("/logs")
-async def get_logs() -> DTO_Logs:
-    return await dependencies.queries.list_logs.execute()
+async def get_logs(
+    limit: int = Query(default=100, ge=1, le=1000),
+    before: int | None = Query(default=None, ge=0),
+    level: str | None = None,
+    component: str | None = None,
+) -> DTO_Logs:
+    return await dependencies.queries.list_logs.execute(
+        limit=limit,
+        before=before,
+        level=level,
+        component=component,
+    )
+
+
+@api_router.get("/logs/stream")
+async def stream_logs(replay: bool = True) -> StreamingResponse:
+    async def events():
+        async for record in dependencies.log_broadcaster.subscribe(replay=replay):
+            if record is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"data: {record.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> str:
+    return await dependencies.queries.get_metrics.execute()
 
 
 @api_router.get("/tasks/sync_all")
 @api_router.post("/tasks/sync_all")
 async def sync():
-    await dependencies.task_scheduler.trigger_sync_task()
+    dependencies.task_scheduler.trigger_all_tasks()
+
+
+@api_router.post("/tasks/sync_missing_series")
+async def sync_missing_series(force_tvdb_refresh: bool = False):
+    # Queued through the scheduler so it never overlaps the scheduled sync,
+    # a pending forced run isn't downgraded by a later regular one
+    if force_tvdb_refresh:
+        dependencies.task_scheduler.trigger_task(
+            "sync_missing_series", force_tvdb_refresh=True
+        )
+    else:
+        dependencies.task_scheduler.trigger_task("sync_missing_series")
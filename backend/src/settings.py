@@ -12,19 +12,50 @@ class AppSettings(BaseSettings):
     DB_CONNECTION_STRING: str
 
     TVDB_API_TOKEN: str
+    TVDB_MAX_CONCURRENT_REQUESTS: int = 5
+    TVDB_CACHE_TTL_HOURS: int = 7 * 24
+    TVDB_CACHE_MEMORY_SIZE: int = 1000
 
     PROWLARR_BASE_URL: str
     PROWLARR_API_TOKEN: str
+    PROWLARR_MAX_CONCURRENT_SEARCHES_PER_INDEXER: int = 2
 
     SONARR_API_TOKEN: str
     SONARR_BASE_URL: str
+    SONARR_MAX_CONCURRENT_REQUESTS: int = 5
 
     QBITTORRENT_BASE_URL: str
     QBITTORRENT_USERNAME: str
     QBITTORRENT_PASSWORD: str
 
     LOG_FILE: str = "logs/log.log"
+    LOG_ENQUEUE: bool = False
+    LOG_STREAM_BUFFER_SIZE: int = 1000
+    LOG_STREAM_SUBSCRIBER_QUEUE_SIZE: int = 1000
+    HTTP_SLOW_CALL_THRESHOLD: float = 5
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_RETRY_BACKOFF_BASE: float = 0.5
+    HTTP_RETRY_BACKOFF_MAX: float = 10
+    HTTP_MAX_RETRY_AFTER: float = 60
+    HTTP_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    HTTP_CIRCUIT_BREAKER_RESET_TIMEOUT: float = 30
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30
     ENABLE_TASK_SCHEDULER: bool = False
 
+    TASK_SYNC_MISSING_SERIES_INTERVAL: int = 60 * 60
+    TASK_SYNC_MISSING_SERIES_JITTER: int = 60
+    TASK_SYNC_MISSING_SERIES_TIMEOUT: int = 30 * 60
+    TASK_IMPORT_TORRENT_STATS_INTERVAL: int = 60
+    TASK_IMPORT_TORRENT_STATS_JITTER: int = 5
+    TASK_IMPORT_TORRENT_STATS_TIMEOUT: int = 60
+    TASK_EXPORT_FINISHED_SERIES_INTERVAL: int = 60 * 60
+    TASK_EXPORT_FINISHED_SERIES_JITTER: int = 60
+    TASK_EXPORT_FINISHED_SERIES_TIMEOUT: int = 10 * 60
+    TASK_RE_GRAB_OUTDATED_RELEASES_INTERVAL: int = 60 * 60
+    TASK_RE_GRAB_OUTDATED_RELEASES_JITTER: int = 60
+    TASK_RE_GRAB_OUTDATED_RELEASES_TIMEOUT: int = 60 * 60
+
 
 app_settings = AppSettings()
@@ -7,23 +7,57 @@ interface Log {
   message: string;
 }
 
+const MAX_LOGS = 500;
+
 const LogsList: React.FC = () => {
   const [logs, setLogs] = useState<Log[]>([]);
 
   useEffect(() => {
+    const apiUrl =
+      process.env.REACT_APP_BACKEND_URL ||
+      `${window.location.protocol}//${window.location.hostname}:${window.location.port}`;
+    let historyLoaded = false;
+    // Records streamed while the history is still loading, newest first
+    let pendingLogs: Log[] = [];
+
+    const logKey = (log: Log) => `${log.time}|${log.level}|${log.component}`;
+
+    // Subscribing before fetching the history keeps records logged in between
+    // from being lost, the ones that made it into both are shown once
+    const eventSource = new EventSource(`${apiUrl}/api/logs/stream?replay=0`);
+    eventSource.onmessage = (event) => {
+      const log: Log = JSON.parse(event.data);
+      if (historyLoaded) {
+        setLogs((prevLogs) => [log, ...prevLogs].slice(0, MAX_LOGS));
+      } else {
+        pendingLogs = [log, ...pendingLogs];
+      }
+    };
+    eventSource.onerror = (error) => {
+      console.error("Error streaming logs:", error);
+    };
+
     const fetchLogs = async () => {
+      let records: Log[] = [];
       try {
-        const apiUrl =
-          process.env.REACT_APP_BACKEND_URL ||
-          `${window.location.protocol}//${window.location.hostname}:${window.location.port}`;
         const response = await fetch(`${apiUrl}/api/logs`);
         const data = await response.json();
-        setLogs(data.records);
+        records = data.records;
       } catch (error) {
         console.error("Error fetching logs:", error);
       }
+      const historyKeys = new Set(records.map(logKey));
+      const newLogs = pendingLogs.filter((log) => !historyKeys.has(logKey(log)));
+      historyLoaded = true;
+      pendingLogs = [];
+      setLogs([...newLogs, ...records].slice(0, MAX_LOGS));
     };
+
     fetchLogs();
+
+    return () => {
+      eventSource.close();
+    };
   }, []);
 
   const formatTime = (isoTime: string): string => {
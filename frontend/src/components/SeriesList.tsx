@@ -1,33 +1,44 @@
 import React, { useEffect, useState } from "react";
 
 interface Show {
-  id: string;
-  tvdb_data: {
-    title: string;
-    year: number;
-    image_url: string;
-  };
+  id: number;
+  title: string;
+  year: number | null;
+  image_url: string | null;
   missing_seasons: number[];
 }
 
+interface ShowList {
+  items: Show[];
+  next_cursor: string | null;
+}
+
 const SeriesList: React.FC = () => {
   const [shows, setShows] = useState<Show[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
 
-  useEffect(() => {
-    const fetchShows = async () => {
-      try {
-        const apiUrl =
-          process.env.REACT_APP_BACKEND_URL ||
-          `${window.location.protocol}//${window.location.hostname}:${window.location.port}`;
-        const response = await fetch(`${apiUrl}/api/shows/?only_missing=1`);
-        const data = await response.json();
-        setShows(data);
-      } catch (error) {
-        console.error("Error fetching shows:", error);
+  const fetchShows = async (cursor: string | null) => {
+    try {
+      const apiUrl =
+        process.env.REACT_APP_BACKEND_URL ||
+        `${window.location.protocol}//${window.location.hostname}:${window.location.port}`;
+      const params = new URLSearchParams({ only_missing: "1" });
+      if (cursor) {
+        params.set("cursor", cursor);
       }
-    };
+      const response = await fetch(`${apiUrl}/api/shows/?${params}`);
+      const data: ShowList = await response.json();
+      setShows((prevShows) =>
+        cursor ? [...prevShows, ...data.items] : data.items
+      );
+      setNextCursor(data.next_cursor);
+    } catch (error) {
+      console.error("Error fetching shows:", error);
+    }
+  };
 
-    fetchShows();
+  useEffect(() => {
+    fetchShows(null);
   }, []);
 
   return (
@@ -36,8 +47,8 @@ const SeriesList: React.FC = () => {
       {shows.map((show) => (
         <div key={show.id} className="bg-gray-800 rounded-lg p-5 mb-5 flex">
           <img
-            src={show.tvdb_data.image_url}
-            alt={show.tvdb_data.title}
+            src={show.image_url || undefined}
+            alt={show.title}
             className="w-24 h-36 rounded-lg mr-5"
           />
           <div>
@@ -46,7 +57,7 @@ const SeriesList: React.FC = () => {
                 href={`/show/${show.id}`}
                 className="text-blue-400 hover:underline"
               >
-                {show.tvdb_data.title} ({show.tvdb_data.year})
+                {show.title} ({show.year})
               </a>
             </h5>
             <p className="mb-2">Сезоны</p>
@@ -63,6 +74,14 @@ const SeriesList: React.FC = () => {
           </div>
         </div>
       ))}
+      {nextCursor && (
+        <button
+          onClick={() => fetchShows(nextCursor)}
+          className="bg-blue-500 text-white py-2 px-4 rounded-lg"
+        >
+          Показать ещё
+        </button>
+      )}
     </div>
   );
 };